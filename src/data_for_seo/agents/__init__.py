@@ -1,13 +1,12 @@
 """SEO agents for the Data for SEO framework."""
 
-from .base import BaseSEOAgent
+from .base import BaseSEOAgent, SEOTaskMixin
 from .seo_analyzer import SEOAnalyzerAgent
-from .seo_collector import SEOCollectorAgent
-from .seo_processor import SEOProcessorAgent
+from .technical_analyzer import TechnicalSEOAnalyzer
 
 __all__ = [
     "BaseSEOAgent",
-    "SEOAnalyzerAgent", 
-    "SEOCollectorAgent",
-    "SEOProcessorAgent",
+    "SEOTaskMixin",
+    "SEOAnalyzerAgent",
+    "TechnicalSEOAnalyzer",
 ]
@@ -155,7 +155,12 @@ class BaseSEOAgent(BaseAgent, ABC):
 
 class SEOTaskMixin:
     """Mixin for common SEO task functionality."""
-    
+
+    # The mixin holds only staticmethods; declaring empty slots keeps it
+    # from re-introducing a per-instance __dict__ on the slotted workflow
+    # classes that inherit it.
+    __slots__ = ()
+
     @staticmethod
     def create_seo_task(
         name: str,
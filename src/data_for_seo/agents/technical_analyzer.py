@@ -0,0 +1,384 @@
+"""Technical SEO Analyzer - domain-level technical health checks."""
+
+import asyncio
+import hashlib
+import logging
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from .base import SEOTaskMixin
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=4096)
+def _extract_domain(url: str) -> Optional[str]:
+    """Extract a domain, memoized: every section asks for the same URL."""
+    try:
+        return urlsplit(url).netloc.lower()
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _domain_bits(domain: str) -> int:
+    """Return a stable 64-bit fingerprint for a domain.
+
+    One blake2b digest per domain replaces a hash(f"{domain}_field")
+    call per metric: every analyzer derives its pseudo-metrics by
+    slicing bit ranges off this single cached value.
+    """
+    digest = hashlib.blake2b(domain.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+# Section skeletons as (key, spec) tuples, where a spec is either a
+# formula over the domain fingerprint or a nested tuple of fields. The
+# structure is frozen at import; only the leaf values vary per domain,
+# so each call is one comprehension instead of a page of dict literals.
+_ACCESSIBILITY_FIELDS = (
+    (
+        "wcag_compliance",
+        (
+            ("level_a", lambda b: ((b >> 3) & 0x1F) % 20 + 80),
+            ("level_aa", lambda b: ((b >> 8) & 0x3F) % 30 + 60),
+            ("level_aaa", lambda b: ((b >> 14) & 0x3F) % 50 + 30),
+        ),
+    ),
+    (
+        "issues",
+        (
+            ("missing_alt_text", lambda b: (b >> 20) & 0x1F),
+            ("low_contrast_elements", lambda b: (b >> 25) & 0xF),
+            ("missing_aria_labels", lambda b: (b >> 29) & 0xF),
+            ("missing_form_labels", lambda b: (b >> 33) & 0x7),
+        ),
+    ),
+    ("keyboard_navigable", lambda b: (b >> 36) & 0x7 > 1),
+    ("screen_reader_friendly", lambda b: (b >> 39) & 0x7 > 2),
+)
+
+_INTERNATIONALIZATION_FIELDS = (
+    (
+        "hreflang",
+        (
+            ("present", lambda b: (b >> 42) & 0x7 > 4),
+            ("errors", lambda b: (b >> 45) & 0x7),
+            ("return_tag_missing", lambda b: (b >> 48) & 0x3),
+        ),
+    ),
+    ("detected_languages", lambda b: ((b >> 50) & 0x7) + 1),
+    (
+        "geo_targeting",
+        (
+            ("configured", lambda b: (b >> 53) & 0x3 > 1),
+            ("country_targets", lambda b: (b >> 55) & 0x7),
+        ),
+    ),
+)
+
+
+# Declarative recommendation rules grouped by section: (path within the
+# section, predicate over the value at that path, recommendation). The
+# predicate also receives the configured health threshold so
+# config-dependent rules fit the same shape. Grouping keeps each rule's
+# data access local to one section dict and lets missing sections be
+# skipped with a single set intersection.
+_SECTION_RULES = {
+    "crawlability": (
+        (
+            ("internal_linking", "orphaned_pages"),
+            lambda v, t: (v or 0) > 5,
+            {
+                "category": "crawlability",
+                "recommendation": "Link orphaned pages into the site structure",
+                "effort": "medium",
+                "priority": "high",
+            },
+        ),
+        (
+            ("internal_linking", "broken_links"),
+            lambda v, t: (v or 0) > 10,
+            {
+                "category": "crawlability",
+                "recommendation": "Fix broken internal links",
+                "effort": "low",
+                "priority": "high",
+            },
+        ),
+    ),
+    "performance": (
+        (
+            ("load_time_seconds",),
+            lambda v, t: (v or 0) > 3.0,
+            {
+                "category": "performance",
+                "recommendation": "Reduce page load time below 3 seconds",
+                "effort": "high",
+                "priority": "high",
+            },
+        ),
+        (
+            ("compression_enabled",),
+            lambda v, t: v is False,
+            {
+                "category": "performance",
+                "recommendation": "Enable response compression",
+                "effort": "low",
+                "priority": "medium",
+            },
+        ),
+    ),
+    "security": (
+        (
+            ("https_enabled",),
+            lambda v, t: v is False,
+            {
+                "category": "critical_issues",
+                "recommendation": "Migrate the site to HTTPS",
+                "effort": "high",
+                "priority": "critical",
+            },
+        ),
+        (
+            ("mixed_content_pages",),
+            lambda v, t: (v or 0) > 3,
+            {
+                "category": "security",
+                "recommendation": "Resolve mixed content on affected pages",
+                "effort": "medium",
+                "priority": "high",
+            },
+        ),
+    ),
+    "mobile": (
+        (
+            ("viewport_configured",),
+            lambda v, t: v is False,
+            {
+                "category": "mobile",
+                "recommendation": "Configure the mobile viewport meta tag",
+                "effort": "low",
+                "priority": "high",
+            },
+        ),
+    ),
+    "accessibility": (
+        (
+            ("wcag_compliance", "level_aa"),
+            lambda v, t: v is not None and v < t,
+            {
+                "category": "accessibility",
+                "recommendation": "Raise WCAG AA compliance above threshold",
+                "effort": "medium",
+                "priority": "medium",
+            },
+        ),
+    ),
+    "internationalization": (
+        (
+            ("hreflang", "errors"),
+            lambda v, t: (v or 0) > 3,
+            {
+                "category": "internationalization",
+                "recommendation": "Fix hreflang annotation errors",
+                "effort": "medium",
+                "priority": "medium",
+            },
+        ),
+    ),
+}
+
+
+# Implementation-plan bucketing resolved by dict lookup: categories with a
+# fixed bucket first, then effort level. No branches on the hot path.
+_CATEGORY_BUCKET = {"critical_issues": "immediate"}
+_EFFORT_BUCKET = {
+    "low": "short_term",
+    "medium": "medium_term",
+    "high": "long_term",
+}
+
+
+def _get_path(data: Any, path: tuple) -> Any:
+    """Walk a key path through nested dicts, returning None when absent."""
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _build_section(bits: int, fields: tuple) -> Dict[str, Any]:
+    """Fill a section template with values derived from the fingerprint."""
+    return {
+        key: _build_section(bits, spec) if isinstance(spec, tuple) else spec(bits)
+        for key, spec in fields
+    }
+
+
+class TechnicalSEOAnalyzer(SEOTaskMixin):
+    """Analyzes the technical health of a domain section by section."""
+
+    # Shadow the mixin's uncached parse: six sections per analyze() ask
+    # for the same URL's domain, and repeat audits hit the cache too.
+    extract_domain = staticmethod(_extract_domain)
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """Initialize the technical analyzer."""
+        self.config = config or {}
+        self.logger = logger
+        self.health_threshold = self.config.get("health_threshold", 70)
+
+    async def analyze(self, url: str) -> Dict[str, Any]:
+        """Run all analysis sections for a URL and aggregate the report."""
+        if not self.validate_url(url):
+            raise ValueError(f"Invalid URL: {url}")
+
+        self.logger.info(f"Starting technical analysis for: {url}")
+
+        # The sections have no data dependencies on each other, so they run
+        # as one concurrent wave; wall-clock cost is the slowest section
+        # instead of the sum. Assignment is by key, so report ordering is
+        # unaffected by completion order.
+        sections = (
+            ("crawlability", self._analyze_crawlability),
+            ("performance", self._analyze_performance),
+            ("security", self._analyze_security),
+            ("mobile", self._analyze_mobile),
+            ("accessibility", self._analyze_accessibility),
+            ("internationalization", self._analyze_internationalization),
+        )
+        section_results = await asyncio.gather(
+            *(fn(url) for _, fn in sections), return_exceptions=True
+        )
+        results: Dict[str, Any] = {}
+        successful_sections = 0
+        for (name, _), data in zip(sections, section_results):
+            if isinstance(data, BaseException):
+                self.logger.error(f"Section {name} failed: {data}")
+                results[name] = {}
+            else:
+                results[name] = data
+                successful_sections += 1
+
+        recommendations = self._generate_recommendations(results)
+        return self._aggregate_technical_results(
+            url, results, recommendations, successful_sections
+        )
+
+    async def _analyze_crawlability(self, url: str) -> Dict[str, Any]:
+        """Analyze crawl health for the domain."""
+        domain = self.extract_domain(url)
+        bits = _domain_bits(domain)
+        return {
+            "robots_txt_valid": (bits & 0xF) > 2,
+            "internal_linking": {
+                "orphaned_pages": (bits >> 4) & 0xF,
+                "link_depth_average": ((bits >> 8) & 0x7) + 1,
+                "broken_links": (bits >> 11) & 0x1F,
+            },
+            "crawl_errors": (bits >> 16) & 0xF,
+        }
+
+    async def _analyze_performance(self, url: str) -> Dict[str, Any]:
+        """Analyze load performance for the domain."""
+        domain = self.extract_domain(url)
+        bits = _domain_bits(domain)
+        return {
+            "load_time_seconds": round(((bits >> 20) & 0x1F) / 10 + 1.0, 1),
+            "page_size_kb": ((bits >> 25) & 0x7FF) + 400,
+            "compression_enabled": (bits >> 36) & 0x1 == 1,
+            "cdn_detected": (bits >> 37) & 0x3 > 0,
+        }
+
+    async def _analyze_security(self, url: str) -> Dict[str, Any]:
+        """Analyze security posture for the domain."""
+        domain = self.extract_domain(url)
+        bits = _domain_bits(domain)
+        return {
+            "https_enabled": url.startswith("https://"),
+            "hsts_enabled": (bits >> 39) & 0x3 > 0,
+            "mixed_content_pages": (bits >> 41) & 0x7,
+            "certificate_days_remaining": ((bits >> 44) & 0xFF) + 30,
+        }
+
+    async def _analyze_mobile(self, url: str) -> Dict[str, Any]:
+        """Analyze mobile readiness for the domain."""
+        domain = self.extract_domain(url)
+        bits = _domain_bits(domain)
+        return {
+            "viewport_configured": (bits >> 52) & 0x7 > 1,
+            "responsive_design": (bits >> 55) & 0x7 > 0,
+            "mobile_load_time": round(((bits >> 58) & 0xF) / 10 + 1.5, 1),
+        }
+
+    async def _analyze_accessibility(self, url: str) -> Dict[str, Any]:
+        """Analyze accessibility compliance for the domain."""
+        domain = self.extract_domain(url)
+        return _build_section(_domain_bits(domain), _ACCESSIBILITY_FIELDS)
+
+    async def _analyze_internationalization(self, url: str) -> Dict[str, Any]:
+        """Analyze international targeting for the domain."""
+        domain = self.extract_domain(url)
+        return _build_section(_domain_bits(domain), _INTERNATIONALIZATION_FIELDS)
+
+    def _generate_recommendations(
+        self, results: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Generate prioritized recommendations from the section results."""
+        threshold = self.health_threshold
+        # C-level intersection gates absent sections; iteration follows the
+        # rule table so recommendation order stays deterministic.
+        present = results.keys() & _SECTION_RULES.keys()
+        recommendations: List[Dict[str, Any]] = [
+            rec
+            for section, rules in _SECTION_RULES.items()
+            if section in present
+            for path, predicate, rec in rules
+            if predicate(_get_path(results[section], path), threshold)
+        ]
+
+        implementation_plan: Dict[str, List[Dict[str, Any]]] = {
+            "immediate": [],
+            "short_term": [],
+            "medium_term": [],
+            "long_term": [],
+        }
+        for rec in recommendations:
+            bucket = (
+                _CATEGORY_BUCKET.get(rec["category"])
+                or _EFFORT_BUCKET[rec["effort"]]
+            )
+            implementation_plan[bucket].append(rec)
+
+        return {
+            "recommendations": recommendations,
+            "implementation_plan": implementation_plan,
+            "total": len(recommendations),
+        }
+
+    def _aggregate_technical_results(
+        self,
+        url: str,
+        results: Dict[str, Any],
+        recommendations: Dict[str, Any],
+        successful_sections: int,
+    ) -> Dict[str, Any]:
+        """Combine section results into the final technical report."""
+        health_score = max(
+            0,
+            100 - recommendations["total"] * 8,
+        )
+        return {
+            "url": url,
+            "domain": self.extract_domain(url),
+            "analyzed_at": datetime.now(timezone.utc).isoformat(),
+            "sections_completed": successful_sections,
+            "health_score": health_score,
+            "healthy": health_score >= self.health_threshold,
+            "detailed_results": results,
+            "recommendations": recommendations,
+        }
@@ -81,6 +81,26 @@ class ExecutionResult(BaseModel):
             execution_time=execution_time,
         )
 
+    def to_json(self) -> bytes:
+        """Serialize the result to JSON bytes.
+
+        Large audit payloads in `data` serialize several times faster
+        through orjson's C encoder than through the stdlib; falls back to
+        json when orjson is unavailable.
+        """
+        payload = self.model_dump(mode="python")
+        try:
+            import orjson
+
+            return orjson.dumps(
+                payload,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            )
+        except ImportError:
+            import json
+
+            return json.dumps(payload, default=str).encode("utf-8")
+
 
 class SEOTask(BaseModel):
     """Base SEO task model."""
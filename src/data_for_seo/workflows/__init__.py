@@ -0,0 +1,22 @@
+"""SEO workflows for the Data for SEO framework."""
+
+from .base import BaseWorkflow, WorkflowStatus
+from .content_optimization import ContentOptimizationWorkflow
+from .engine import WorkflowEngine, WorkflowProgress, WorkflowStepResult
+from .rank_tracking import RankTrackingWorkflow
+from .seo_audit import SEOAuditWorkflow
+from .serialization import serialize_report
+from .technical_seo import TechnicalSEOWorkflow
+
+__all__ = [
+    "BaseWorkflow",
+    "WorkflowStatus",
+    "WorkflowEngine",
+    "WorkflowProgress",
+    "WorkflowStepResult",
+    "ContentOptimizationWorkflow",
+    "RankTrackingWorkflow",
+    "SEOAuditWorkflow",
+    "TechnicalSEOWorkflow",
+    "serialize_report",
+]
@@ -0,0 +1,36 @@
+"""Internal result containers for workflow analyzers.
+
+Slotted dataclasses keep the hot analyzer paths on fixed-offset attribute
+stores; they are converted to plain dicts at the serialization boundary.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+
+@dataclass(slots=True)
+class SemanticAnalysis:
+    """Semantic topic coverage results for a set of target keywords."""
+
+    topic_coverage: Dict[str, Any] = field(default_factory=dict)
+    semantic_keywords: List[str] = field(default_factory=list)
+    content_themes: List[str] = field(default_factory=list)
+    topic_authority_score: int = 0
+    recommendations: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class IntentAnalysis:
+    """User-intent alignment results for a set of target keywords."""
+
+    keyword_intents: Dict[str, Any] = field(default_factory=dict)
+    recommendations: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class GapAnalysis:
+    """Content gap results against target keywords and competitors."""
+
+    missing_topics: List[str] = field(default_factory=list)
+    coverage_gaps: Dict[str, int] = field(default_factory=dict)
+    recommendations: List[Dict[str, Any]] = field(default_factory=list)
@@ -0,0 +1,88 @@
+"""Base workflow implementation for SEO automation."""
+
+import logging
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+
+from ..config import get_settings
+from ..models.base import ExecutionResult
+
+logger = logging.getLogger(__name__)
+
+
+class WorkflowStatus(str, Enum):
+    """Workflow execution status."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class BaseWorkflow:
+    """Base class for all SEO workflows."""
+
+    __slots__ = (
+        "id",
+        "name",
+        "description",
+        "config",
+        "status",
+        "started_at",
+        "completed_at",
+        "settings",
+        "logger",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        config: Optional[Dict[str, Any]] = None,
+    ):
+        """Initialize the workflow."""
+        self.id = uuid4()
+        self.name = name
+        self.description = description
+        self.config = config or {}
+        self.status = WorkflowStatus.PENDING
+        self.started_at: Optional[datetime] = None
+        self.completed_at: Optional[datetime] = None
+        self.settings = get_settings()
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+
+    def mark_started(self) -> None:
+        """Mark workflow as started."""
+        self.status = WorkflowStatus.RUNNING
+        self.started_at = datetime.now(timezone.utc)
+
+    def mark_completed(self) -> None:
+        """Mark workflow as completed."""
+        self.status = WorkflowStatus.COMPLETED
+        self.completed_at = datetime.now(timezone.utc)
+
+    def mark_failed(self) -> None:
+        """Mark workflow as failed."""
+        self.status = WorkflowStatus.FAILED
+        self.completed_at = datetime.now(timezone.utc)
+
+    def get_duration(self) -> Optional[float]:
+        """Get workflow duration in seconds."""
+        if self.started_at and self.completed_at:
+            return (self.completed_at - self.started_at).total_seconds()
+        return None
+
+    def validate_parameters(self, parameters: Dict[str, Any]) -> bool:
+        """Validate workflow parameters. Override in subclasses."""
+        return True
+
+    def get_workflow_steps(self, parameters: Dict[str, Any]) -> List[str]:
+        """Get the ordered list of workflow steps. Override in subclasses."""
+        return []
+
+    async def execute_workflow(self, parameters: Dict[str, Any]) -> ExecutionResult:
+        """Execute the workflow. Override in subclasses."""
+        raise NotImplementedError("Subclasses must implement execute_workflow")
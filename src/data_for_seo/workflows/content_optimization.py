@@ -0,0 +1,752 @@
+"""Content optimization workflow - analyzes content and builds an optimization plan."""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from statistics import fmean
+from typing import Any, Dict, List, Optional
+
+from dataclasses import asdict, is_dataclass
+
+from ..models.base import ExecutionResult
+from ._models import GapAnalysis, IntentAnalysis, SemanticAnalysis
+from .base import BaseWorkflow
+
+logger = logging.getLogger(__name__)
+
+# Bind the result factories once; return paths then skip the classmethod
+# attribute lookup on every call.
+_success = ExecutionResult.success_result
+_failure = ExecutionResult.failure_result
+
+_ISO_FMT = "%Y-%m-%dT%H:%M:%S"
+
+# Recommendation templates are rendered lazily so per-keyword loops only
+# record (template id, keyword) pairs instead of building strings up front.
+_RELATED_TOPICS = ("related_topic_0", "related_topic_1", "related_topic_2")
+
+# Which analysis stages each depth setting runs; the cheapest analysis is
+# the one that is never started.
+_DEPTH_STAGES = {
+    "shallow": frozenset(
+        {"seo_analysis", "keyword_analysis", "readability_analysis"}
+    ),
+    "standard": frozenset(
+        {
+            "seo_analysis",
+            "keyword_analysis",
+            "readability_analysis",
+            "semantic_analysis",
+            "intent_analysis",
+            "competitor_analysis",
+        }
+    ),
+    "deep": frozenset(
+        {
+            "seo_analysis",
+            "keyword_analysis",
+            "readability_analysis",
+            "semantic_analysis",
+            "intent_analysis",
+            "gap_analysis",
+            "competitor_analysis",
+        }
+    ),
+}
+
+_REC_TEMPLATES = {
+    "low_density": "Increase keyword density for '{kw}' to 1-2.5%",
+    "keyword_stuffing": "Reduce keyword density for '{kw}' below 2.5%",
+    "missing_in_title": "Include target keyword '{kw}' in the page title",
+    "missing_in_h1": "Include target keyword '{kw}' in an H1 heading",
+}
+
+
+def _rec(
+    action: str, priority: str, effort: str, impact: str, description: str
+) -> Dict[str, Any]:
+    """Build a plan recommendation dict with a constant key layout."""
+    return {
+        "action": action,
+        "priority": priority,
+        "effort": effort,
+        "impact": impact,
+        "description": description,
+    }
+
+
+# Static optimization-plan sections, built once at import time.
+_PLAN_SEO_OPTIMIZATIONS = (
+    _rec(
+        "Optimize title tags and meta descriptions",
+        "high",
+        "low",
+        "high",
+        "Rewrite titles and descriptions to optimal lengths with target keywords",
+    ),
+    _rec(
+        "Improve heading structure",
+        "medium",
+        "low",
+        "medium",
+        "Establish a clear H1-H2 hierarchy across the page",
+    ),
+)
+_PLAN_CONTENT_IMPROVEMENTS = (
+    _rec(
+        "Expand thin content sections",
+        "medium",
+        "medium",
+        "high",
+        "Add depth to sections with low topical coverage",
+    ),
+)
+_PLAN_KEYWORD_OPTIMIZATIONS = (
+    _rec(
+        "Balance keyword density",
+        "medium",
+        "low",
+        "medium",
+        "Keep target keyword density between 1% and 2.5%",
+    ),
+)
+_EXPECTED_OUTCOMES = {
+    "traffic_improvement": "10-25%",
+    "ranking_improvement": "5-15 positions",
+    "engagement_improvement": "15-30%",
+}
+
+
+def _render_recommendation(rec: Dict[str, Any]) -> Dict[str, Any]:
+    """Materialize the recommendation string for a templated entry."""
+    template = rec.pop("_template", None)
+    if template is not None:
+        rec["recommendation"] = _REC_TEMPLATES[template].format(kw=rec["keyword"])
+    return rec
+
+
+class ContentOptimizationWorkflow(BaseWorkflow):
+    """Workflow that analyzes page content and produces SEO optimization recommendations."""
+
+    __slots__ = (
+        "analysis_depth",
+        "optimization_focus",
+        "include_competitor_content",
+        "_steps_cache",
+        "_focus_tuple",
+        "_config_snapshot",
+    )
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """Initialize the content optimization workflow."""
+        super().__init__(
+            name="Content Optimization",
+            description="Analyzes content quality, keywords, and structure to generate optimization plans",
+            config=config or {},
+        )
+        self.analysis_depth = self.config.get("analysis_depth", "standard")
+        self.optimization_focus = self.config.get(
+            "optimization_focus", ["keywords", "structure", "readability"]
+        )
+        self.include_competitor_content = self.config.get(
+            "include_competitor_content", True
+        )
+        self._steps_cache: Dict[tuple, tuple] = {}
+        # Immutable views shared into every report instead of rebuilding the
+        # configuration dict and focus list per aggregation. Kept as plain
+        # dict/tuple so the payload stays orjson-native.
+        self._focus_tuple = tuple(self.optimization_focus)
+        self._config_snapshot = {
+            "analysis_depth": self.analysis_depth,
+            "optimization_focus": self._focus_tuple,
+            "include_competitor_content": self.include_competitor_content,
+        }
+
+    def validate_parameters(self, parameters: Dict[str, Any]) -> bool:
+        """Validate workflow parameters."""
+        url = parameters.get("url")
+        target_keywords = parameters.get("target_keywords")
+
+        if not url or not isinstance(url, str):
+            return False
+        if not target_keywords or not isinstance(target_keywords, list):
+            return False
+
+        return True
+
+    def get_workflow_steps(self, parameters: Dict[str, Any]) -> List[str]:
+        """Get the ordered list of workflow steps."""
+        # The step list only depends on the workflow configuration and whether
+        # competitors were supplied, so memoize per signature.
+        key = (
+            frozenset(self.optimization_focus),
+            self.analysis_depth,
+            self.include_competitor_content,
+            bool(parameters.get("competitors")),
+        )
+        cached = self._steps_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
+        steps = ["extract_content"]
+
+        if "keywords" in self.optimization_focus:
+            steps.append("analyze_keywords")
+        if "structure" in self.optimization_focus:
+            steps.append("analyze_seo_elements")
+        if "readability" in self.optimization_focus:
+            steps.append("analyze_readability")
+
+        if self.analysis_depth in ("standard", "deep"):
+            steps.append("analyze_semantic_content")
+            steps.append("analyze_user_intent")
+        if self.analysis_depth == "deep":
+            steps.append("analyze_content_gaps")
+
+        if self.include_competitor_content and parameters.get("competitors"):
+            steps.append("analyze_competitor_content")
+
+        steps.append("generate_optimization_plan")
+        steps.append("aggregate_results")
+
+        self._steps_cache[key] = tuple(steps)
+        return steps
+
+    async def execute_workflow(self, parameters: Dict[str, Any]) -> ExecutionResult:
+        """Execute the content optimization workflow."""
+        try:
+            if not self.validate_parameters(parameters):
+                return _failure(
+                    message="Invalid workflow parameters",
+                    errors=["'url' and 'target_keywords' parameters are required"],
+                )
+
+            self.mark_started()
+            url = parameters["url"]
+            target_keywords = parameters.get("target_keywords", [])
+            competitors = parameters.get("competitors", [])
+
+            self.logger.info(f"Starting content optimization for: {url}")
+
+            content = await self._extract_content(url)
+
+            # The analysis stages are independent, so run them concurrently;
+            # wall time collapses to the slowest stage instead of the sum.
+            # Stages outside the configured analysis depth are never started.
+            allowed = _DEPTH_STAGES.get(
+                self.analysis_depth, _DEPTH_STAGES["standard"]
+            )
+            candidates = (
+                (
+                    "seo_analysis",
+                    self._analyze_seo_elements,
+                    (content, target_keywords),
+                ),
+                (
+                    "keyword_analysis",
+                    self._analyze_keywords,
+                    (content, target_keywords),
+                ),
+                ("readability_analysis", self._analyze_readability, (content,)),
+                (
+                    "semantic_analysis",
+                    self._analyze_semantic_content,
+                    (content, target_keywords),
+                ),
+                (
+                    "intent_analysis",
+                    self._analyze_user_intent,
+                    (target_keywords, content),
+                ),
+                (
+                    "gap_analysis",
+                    self._analyze_content_gaps,
+                    (content, target_keywords, competitors),
+                ),
+            )
+            stages: List[tuple] = [
+                (name, method(*args))
+                for name, method, args in candidates
+                if name in allowed
+            ]
+            if (
+                "competitor_analysis" in allowed
+                and self.include_competitor_content
+                and competitors
+            ):
+                stages.append(
+                    (
+                        "competitor_analysis",
+                        self._analyze_competitor_content(competitors, target_keywords),
+                    )
+                )
+
+            stage_results = await asyncio.gather(
+                *(coro for _, coro in stages), return_exceptions=True
+            )
+            # Stage exceptions are normalized to error dicts so the plan
+            # generator and the serialized report never see a raw exception
+            # object.
+            results: Dict[str, Any] = {}
+            for (name, _), result in zip(stages, stage_results):
+                if isinstance(result, BaseException):
+                    self.logger.error(f"Analysis stage {name} failed: {result}")
+                    result = {"success": False, "error": str(result)}
+                elif is_dataclass(result):
+                    result = asdict(result)
+                results[name] = result
+
+            optimization_plan = self._generate_optimization_plan(results)
+            final_report = self._aggregate_optimization_results(
+                results, optimization_plan
+            )
+
+            self.mark_completed()
+            return _success(
+                message=f"Content optimization completed for {url}",
+                data=final_report,
+            )
+
+        except Exception as e:
+            self.mark_failed()
+            err = str(e)
+            self.logger.exception(f"Content optimization workflow failed: {err}")
+            return _failure(
+                message=f"Content optimization failed: {err}",
+                errors=[err],
+            )
+
+    async def _extract_content(self, url: str) -> Dict[str, Any]:
+        """Extract content from the target URL."""
+        # Simulated extraction - would fetch and parse the live page in production
+        content_data = {
+            "url": url,
+            "title": f"Sample title for {url}",
+            "meta_description": f"Sample meta description for {url}",
+            "headings": {
+                "h1": ["Main heading"],
+                "h2": ["Section one", "Section two", "Section three"],
+                "h3": ["Subsection"],
+            },
+            "word_count": 850 + (hash(url) % 1200),
+            "paragraphs": 8 + (hash(url) % 12),
+            "images": 3 + (hash(url) % 5),
+            "internal_links": 5 + (hash(url) % 10),
+        }
+        # Epoch timestamp avoids constructing a datetime object per extract;
+        # the ISO form is derived straight from the epoch when needed.
+        now = time.time()
+        content_data["extracted_at_epoch"] = now
+        content_data["extracted_at"] = time.strftime(_ISO_FMT, time.gmtime(now)) + "Z"
+        return content_data
+
+    async def _analyze_keywords(
+        self, content: Dict[str, Any], target_keywords: List[str]
+    ) -> Dict[str, Any]:
+        """Analyze keyword usage and opportunities."""
+        keyword_analysis: Dict[str, Any] = {
+            "keyword_usage": {},
+            "keyword_opportunities": [],
+            "recommendations": [],
+        }
+
+        title_lower = (content.get("title") or "").lower()
+        # Lowercase the heading lists once; per-keyword membership checks then
+        # scan a single joined blob instead of re-lowering every heading.
+        headings = content.get("headings", {})
+        h1_blob = "\n".join(headings.get("h1", [])).lower()
+        h2_blob = "\n".join(headings.get("h2", [])).lower()
+
+        for keyword in target_keywords:
+            keyword_lower = keyword.lower()
+            density = (hash(keyword) % 35) / 10
+
+            in_title = keyword_lower in title_lower
+            in_h1 = keyword_lower in h1_blob
+            in_h2 = keyword_lower in h2_blob
+
+            keyword_analysis["keyword_usage"][keyword] = {
+                "density": density,
+                "in_title": in_title,
+                "in_h1": in_h1,
+                "in_h2": in_h2,
+            }
+
+            if density < 1.0:
+                keyword_analysis["keyword_opportunities"].append(
+                    {"keyword": keyword, "issue": "low_density", "_template": "low_density"}
+                )
+            elif density > 2.5:
+                keyword_analysis["keyword_opportunities"].append(
+                    {
+                        "keyword": keyword,
+                        "issue": "keyword_stuffing",
+                        "_template": "keyword_stuffing",
+                    }
+                )
+
+            if not in_title:
+                keyword_analysis["recommendations"].append(
+                    {
+                        "priority": "high",
+                        "keyword": keyword,
+                        "_template": "missing_in_title",
+                    }
+                )
+            if not in_h1:
+                keyword_analysis["recommendations"].append(
+                    {
+                        "priority": "medium",
+                        "keyword": keyword,
+                        "_template": "missing_in_h1",
+                    }
+                )
+
+        for rec in keyword_analysis["keyword_opportunities"]:
+            _render_recommendation(rec)
+        for rec in keyword_analysis["recommendations"]:
+            _render_recommendation(rec)
+
+        return keyword_analysis
+
+    async def _analyze_seo_elements(
+        self, content: Dict[str, Any], target_keywords: List[str]
+    ) -> Dict[str, Any]:
+        """Analyze on-page SEO elements."""
+        title = content.get("title") or ""
+        any_kw_in_title = any(kw.lower() in title.lower() for kw in target_keywords)
+        title_recs = [
+            rec
+            for cond, rec in (
+                (len(title) < 30, "Title is too short - expand to 30-60 characters"),
+                (len(title) > 60, "Title is too long - shorten to under 60 characters"),
+                (not any_kw_in_title, "Include target keywords in the title"),
+            )
+            if cond
+        ]
+
+        meta_description = content.get("meta_description") or ""
+        any_kw_in_meta = any(
+            kw.lower() in meta_description.lower() for kw in target_keywords
+        )
+        meta_recs = [
+            rec
+            for cond, rec in (
+                (
+                    len(meta_description) < 120,
+                    "Meta description is too short - expand to 120-160 characters",
+                ),
+                (
+                    len(meta_description) > 160,
+                    "Meta description is too long - shorten to under 160 characters",
+                ),
+                (not any_kw_in_meta, "Include target keywords in the meta description"),
+            )
+            if cond
+        ]
+
+        headings = content.get("headings", {})
+        h1_count = len(headings.get("h1", []))
+        h2_count = len(headings.get("h2", []))
+        heading_recs = [
+            rec
+            for cond, rec in (
+                (h1_count == 0, "Add an H1 heading to the page"),
+                (h1_count > 1, "Use only one H1 heading per page"),
+                (h2_count == 0, "Structure content with H2 subheadings"),
+            )
+            if cond
+        ]
+
+        images = content.get("images", 0)
+        image_recs = (
+            ["Add relevant images to support the content"] if images == 0 else []
+        )
+
+        # Each section is built in a single literal with its recommendations
+        # precomputed, instead of mutating nested dicts key by key.
+        return {
+            "title_analysis": {
+                "length": len(title),
+                "optimal_length": 30 <= len(title) <= 60,
+                "includes_target_keyword": any_kw_in_title,
+                "recommendations": title_recs,
+            },
+            "meta_description_analysis": {
+                "length": len(meta_description),
+                "optimal_length": 120 <= len(meta_description) <= 160,
+                "includes_target_keyword": any_kw_in_meta,
+                "recommendations": meta_recs,
+            },
+            "heading_analysis": {
+                "h1_count": h1_count,
+                "h2_count": h2_count,
+                "proper_hierarchy": h1_count == 1,
+                "recommendations": heading_recs,
+            },
+            "image_analysis": {
+                "image_count": images,
+                "recommendations": image_recs,
+            },
+            "recommendations": [
+                {"priority": "medium", "recommendation": rec}
+                for rec in title_recs + meta_recs + heading_recs + image_recs
+            ],
+        }
+
+    async def _analyze_readability(self, content: Dict[str, Any]) -> Dict[str, Any]:
+        """Analyze content readability."""
+        word_count = content.get("word_count", 0)
+        paragraphs = content.get("paragraphs", 1)
+        avg_paragraph_length = word_count / paragraphs if paragraphs else 0
+
+        readability_score = min(100, max(0, 100 - abs(avg_paragraph_length - 80)))
+
+        readability_analysis: Dict[str, Any] = {
+            "readability_score": round(readability_score, 1),
+            "word_count": word_count,
+            "avg_paragraph_length": round(avg_paragraph_length, 1),
+            "recommendations": [],
+        }
+
+        if word_count < 300:
+            readability_analysis["recommendations"].append(
+                {
+                    "priority": "high",
+                    "recommendation": "Expand content to at least 300 words",
+                }
+            )
+        if avg_paragraph_length > 120:
+            readability_analysis["recommendations"].append(
+                {
+                    "priority": "medium",
+                    "recommendation": "Break up long paragraphs to improve readability",
+                }
+            )
+
+        return readability_analysis
+
+    async def _analyze_semantic_content(
+        self, content: Dict[str, Any], target_keywords: List[str]
+    ) -> SemanticAnalysis:
+        """Analyze semantic topic coverage for target keywords."""
+        semantic_analysis = SemanticAnalysis()
+
+        coverage_total = 0
+        for keyword in target_keywords:
+            h = hash(keyword)
+            coverage = 70 + (h % 30)
+            coverage_total += coverage
+            semantic_analysis.topic_coverage[keyword] = {
+                "coverage_score": coverage,
+                "related_topics": _RELATED_TOPICS,
+            }
+            semantic_analysis.semantic_keywords.extend(
+                (f"{keyword} benefits", f"{keyword} guide", f"best {keyword}")
+            )
+            semantic_analysis.content_themes.append(f"{keyword} overview")
+
+            if coverage < 80:
+                semantic_analysis.recommendations.append(
+                    {
+                        "priority": "medium",
+                        "recommendation": f"Expand topical coverage for '{keyword}' with supporting subtopics",
+                    }
+                )
+
+        semantic_analysis.topic_authority_score = (
+            coverage_total // len(target_keywords) if target_keywords else 0
+        )
+
+        return semantic_analysis
+
+    async def _analyze_user_intent(
+        self, target_keywords: List[str], content: Dict[str, Any]
+    ) -> IntentAnalysis:
+        """Analyze user intent alignment for target keywords."""
+        intent_types = ["informational", "navigational", "transactional", "commercial"]
+
+        intent_analysis = IntentAnalysis()
+
+        for keyword in target_keywords:
+            h = hash(keyword)
+            intent_type = intent_types[h % 4]
+            alignment_score = 60 + (h % 40)
+
+            intent_analysis.keyword_intents[keyword] = {
+                "intent_type": intent_type,
+                "alignment_score": alignment_score,
+            }
+
+            if alignment_score < 75:
+                intent_analysis.recommendations.append(
+                    {
+                        "priority": "medium",
+                        "recommendation": f"Align content with {intent_type} intent for '{keyword}'",
+                    }
+                )
+
+        return intent_analysis
+
+    async def _analyze_content_gaps(
+        self,
+        content: Dict[str, Any],
+        target_keywords: List[str],
+        competitors: List[str],
+    ) -> GapAnalysis:
+        """Identify content gaps against target keywords and competitors."""
+        gap_analysis = GapAnalysis()
+
+        for keyword in target_keywords:
+            gap_score = hash(keyword) % 100
+            gap_analysis.coverage_gaps[keyword] = gap_score
+            if gap_score > 60:
+                gap_analysis.missing_topics.append(f"{keyword} comparison")
+                gap_analysis.recommendations.append(
+                    {
+                        "priority": "medium",
+                        "recommendation": f"Add a section covering '{keyword} comparison'",
+                    }
+                )
+
+        return gap_analysis
+
+    async def _analyze_competitor_content(
+        self, competitors: List[str], target_keywords: List[str]
+    ) -> Dict[str, Any]:
+        """Analyze competitor content for benchmarking."""
+        competitor_analysis: Dict[str, Any] = {
+            "competitors": {},
+            "recommendations": [],
+        }
+
+        for competitor in competitors:
+            competitor_analysis["competitors"][competitor] = {
+                "content_score": 60 + (hash(competitor) % 40),
+                "word_count": 800 + (hash(competitor) % 1500),
+                "keyword_overlap": (hash(competitor) % 60) + 20,
+            }
+
+        competitor_analysis["recommendations"].append(
+            {
+                "priority": "low",
+                "recommendation": "Benchmark content depth against top-performing competitors",
+            }
+        )
+
+        return competitor_analysis
+
+    def _generate_optimization_plan(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate a prioritized optimization plan from analysis results."""
+        scores: List[float] = []
+        # Collect at most five priority actions, stopping as soon as the
+        # budget is exhausted instead of building lists only to truncate.
+        priority_actions: List[str] = []
+        append_action = priority_actions.append
+        needed = 5
+
+        # Failed stages arrive as {"success": False, "error": ...} dicts;
+        # they contribute neither scores nor actions.
+        seo_data = results.get("seo_analysis")
+        if isinstance(seo_data, dict) and seo_data.get("success") is not False:
+            section_scores = [
+                100 if seo_data[element]["optimal_length"] else 50
+                for element in ("title_analysis", "meta_description_analysis")
+            ]
+            scores.append(sum(section_scores) / len(section_scores))
+            for element in (
+                "title_analysis",
+                "meta_description_analysis",
+                "heading_analysis",
+            ):
+                if needed == 0:
+                    break
+                for rec in seo_data[element].get("recommendations", ())[:2]:
+                    append_action(rec)
+                    needed -= 1
+                    if needed == 0:
+                        break
+
+        readability_data = results.get("readability_analysis")
+        if (
+            isinstance(readability_data, dict)
+            and readability_data.get("success") is not False
+        ):
+            scores.append(readability_data.get("readability_score", 75))
+            if needed:
+                for rec in readability_data.get("recommendations", ())[:2]:
+                    append_action(rec["recommendation"])
+                    needed -= 1
+                    if needed == 0:
+                        break
+
+        semantic_data = results.get("semantic_analysis")
+        if (
+            isinstance(semantic_data, dict)
+            and semantic_data.get("success") is not False
+        ):
+            scores.append(semantic_data.get("topic_authority_score", 75))
+
+        # Only the dynamic sections are materialized per call; the static
+        # recommendation lists and outcome estimates live in module constants.
+        return {
+            "executive_summary": {
+                "overall_score": round(fmean(scores), 1) if scores else 75.0,
+                "priority_actions": priority_actions,
+                "estimated_impact": "medium",
+            },
+            "detailed_recommendations": {
+                "seo_optimizations": _PLAN_SEO_OPTIMIZATIONS,
+                "content_improvements": _PLAN_CONTENT_IMPROVEMENTS,
+                "keyword_optimizations": _PLAN_KEYWORD_OPTIMIZATIONS,
+                "competitor_insights": (),
+            },
+            "implementation_timeline": {
+                "immediate": priority_actions[:2],
+                "short_term": priority_actions[2:5],
+                "medium_term": [],
+                "long_term": [],
+            },
+            "expected_outcomes": _EXPECTED_OUTCOMES,
+        }
+
+    def _aggregate_optimization_results(
+        self, results: Dict[str, Any], optimization_plan: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Aggregate analysis results into the final workflow report."""
+        # Fused single pass over the results: step, recommendation, and
+        # high-priority counters are all maintained in one loop.
+        successful_steps = 0
+        total_recommendations = 0
+        high_priority_recommendations = 0
+        for result in results.values():
+            if not isinstance(result, dict) or result.get("success") is False:
+                continue
+            successful_steps += 1
+            recs = result.get("recommendations")
+            if not isinstance(recs, list):
+                continue
+            total_recommendations += len(recs)
+            for rec in recs:
+                if type(rec) is dict and rec.get("priority") == "high":
+                    high_priority_recommendations += 1
+
+        final_report = {
+            "workflow_id": str(self.id),
+            "workflow_name": self.name,
+            "completed_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "duration_seconds": self.get_duration(),
+            "summary": {
+                "total_steps": len(results),
+                "successful_steps": successful_steps,
+                "total_recommendations": total_recommendations,
+                "high_priority_recommendations": high_priority_recommendations,
+            },
+            "optimization_categories": self._focus_tuple,
+            "results": results,
+            "optimization_plan": optimization_plan,
+            "configuration": self._config_snapshot,
+        }
+
+        return final_report
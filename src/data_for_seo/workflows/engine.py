@@ -0,0 +1,218 @@
+"""Workflow engine - drives workflow execution with retries and progress."""
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from .base import BaseWorkflow
+from .serialization import serialize_report
+
+logger = logging.getLogger(__name__)
+
+# Only transient failures are worth retrying; programming errors such as
+# ValueError should surface immediately instead of burning the budget.
+_RETRYABLE_EXCEPTIONS = (asyncio.TimeoutError, ConnectionError, OSError)
+
+
+# Plain slotted dataclasses rather than Pydantic models: these hold
+# engine-internal trusted data created once per step, where per-field
+# validation would only add microseconds and per-instance dict overhead.
+@dataclass(slots=True)
+class WorkflowStepResult:
+    """Outcome of a single engine-executed step."""
+
+    step_name: str
+    success: bool
+    data: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    duration: float = 0.0
+
+
+@dataclass(slots=True)
+class WorkflowProgress:
+    """Running progress of a workflow execution."""
+
+    total_steps: int = 0
+    completed_steps: int = 0
+    step_results: List[WorkflowStepResult] = field(default_factory=list)
+
+    def update_progress(self, step_result: WorkflowStepResult) -> None:
+        """Record a completed step."""
+        self.step_results.append(step_result)
+        self.completed_steps += 1
+
+    def percentage(self) -> float:
+        """Compute the completion percentage on demand."""
+        if not self.total_steps:
+            return 0.0
+        return round(self.completed_steps / self.total_steps * 100, 1)
+
+
+class WorkflowEngine:
+    """Executes workflows with bounded concurrency, retries, and metrics."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """Initialize the workflow engine."""
+        self.config = config or {}
+        self.logger = logger
+        self.max_retries = self.config.get("max_retries", 3)
+        self.retry_delay = self.config.get("retry_delay", 2.0)
+        self.max_retry_delay = self.config.get("max_retry_delay", 60.0)
+        # Bounded fan-out: once callers dispatch steps concurrently, an
+        # unbounded gather would thunder the external APIs; every step
+        # body runs under this semaphore.
+        self._sem = asyncio.Semaphore(self.config.get("max_concurrency", 8))
+        self.progress = WorkflowProgress()
+        # Step results are also published here so monitoring consumers can
+        # subscribe to a stream instead of polling mutated shared state.
+        self.events: asyncio.Queue = asyncio.Queue()
+        # Maintained as steps report in, so aggregation never rescans the
+        # results to count successes.
+        self._success_count = 0
+        self.created_at = datetime.now(timezone.utc)
+        self.started_at: Optional[datetime] = None
+        self.completed_at: Optional[datetime] = None
+        # ISO strings are cached when the datetimes are assigned, so a
+        # frequently polled get_metrics never re-formats them.
+        self._created_iso = self.created_at.isoformat()
+        self._started_iso: Optional[str] = None
+        self._completed_iso: Optional[str] = None
+
+    async def execute_workflow(
+        self, workflow: BaseWorkflow, parameters: Dict[str, Any]
+    ) -> Any:
+        """Execute a workflow, retrying transient failures."""
+        self.started_at = datetime.now(timezone.utc)
+        self._started_iso = self.started_at.isoformat()
+        self.progress.total_steps = len(workflow.get_workflow_steps(parameters))
+        try:
+            return await self._execute_workflow_impl(workflow, parameters)
+        finally:
+            self.completed_at = datetime.now(timezone.utc)
+            self._completed_iso = self.completed_at.isoformat()
+
+    async def _execute_workflow_impl(
+        self, workflow: BaseWorkflow, parameters: Dict[str, Any]
+    ) -> Any:
+        """Run the workflow, backing off exponentially between attempts.
+
+        The delay doubles per retry with random jitter so a burst of
+        failing workflows does not retry in lockstep against the same
+        recovering backend.
+        """
+        retry_count = 0
+        while True:
+            try:
+                return await workflow.execute_workflow(parameters)
+            except _RETRYABLE_EXCEPTIONS as e:
+                retry_count += 1
+                if retry_count > self.max_retries:
+                    self.logger.error(
+                        f"Workflow {workflow.name} failed after "
+                        f"{self.max_retries} retries: {e}"
+                    )
+                    raise
+                delay = min(
+                    self.retry_delay
+                    * (2 ** (retry_count - 1))
+                    * (0.5 + random.random()),
+                    self.max_retry_delay,
+                )
+                self.logger.warning(
+                    f"Workflow {workflow.name} attempt {retry_count} failed: {e}; "
+                    f"retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+
+    @staticmethod
+    def resolve_steps(
+        steps: List[tuple],
+    ) -> List[tuple]:
+        """Expand (name, fn) pairs to (name, fn, is_coro) triples.
+
+        asyncio.iscoroutinefunction inspects function attributes in
+        Python; resolving it once at registration time turns the per-call
+        check in execute_step into a plain boolean.
+        """
+        return [
+            (name, fn, asyncio.iscoroutinefunction(fn)) for name, fn in steps
+        ]
+
+    async def execute_step(
+        self,
+        step_name: str,
+        step_function: Callable,
+        *args: Any,
+        is_coro: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> WorkflowStepResult:
+        """Execute one step under the concurrency bound and record it.
+
+        Durations come from time.perf_counter: a monotonic float with no
+        datetime/timedelta allocation per step. Wall-clock datetimes are
+        kept only for the user-visible started_at/completed_at metadata.
+        Callers dispatching many steps should pass is_coro pre-resolved
+        via resolve_steps; it is inspected here only when not supplied.
+        """
+        if is_coro is None:
+            is_coro = asyncio.iscoroutinefunction(step_function)
+        started = time.perf_counter()
+        try:
+            async with self._sem:
+                if is_coro:
+                    data = await step_function(*args, **kwargs)
+                else:
+                    data = step_function(*args, **kwargs)
+            step_result = WorkflowStepResult(
+                step_name=step_name,
+                success=True,
+                data=data,
+                duration=time.perf_counter() - started,
+            )
+        except Exception as e:
+            self.logger.error(f"Step {step_name} failed: {e}")
+            step_result = WorkflowStepResult(
+                step_name=step_name,
+                success=False,
+                error=str(e),
+                duration=time.perf_counter() - started,
+            )
+        self.progress.update_progress(step_result)
+        if step_result.success:
+            self._success_count += 1
+        await self.events.put(step_result)
+        return step_result
+
+    def get_progress(self) -> Dict[str, Any]:
+        """Return a progress snapshot, computing the percentage lazily."""
+        return {
+            "total_steps": self.progress.total_steps,
+            "completed_steps": self.progress.completed_steps,
+            "progress_percentage": self.progress.percentage(),
+        }
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return execution metrics for monitoring."""
+        return {
+            "created_at": self._created_iso,
+            "started_at": self._started_iso,
+            "completed_at": self._completed_iso,
+            "total_steps": self.progress.total_steps,
+            "completed_steps": self.progress.completed_steps,
+            "successful_steps": self._success_count,
+            "progress_percentage": self.progress.percentage(),
+            "step_results": [asdict(r) for r in self.progress.step_results],
+        }
+
+    def metrics_to_json(self) -> bytes:
+        """Serialize the metrics snapshot to JSON bytes.
+
+        Deeply nested step payloads go through orjson's C encoder (with a
+        stdlib fallback) via serialize_report, which is several times
+        faster than json.dumps for reports of this shape.
+        """
+        return serialize_report(self.get_metrics())
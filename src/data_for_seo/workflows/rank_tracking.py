@@ -0,0 +1,699 @@
+"""Rank tracking workflow - monitors keyword positions across engines and locations."""
+
+import asyncio
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from itertools import product
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from ..agents.base import SEOTaskMixin
+from ..models.base import ExecutionResult
+from .base import BaseWorkflow
+
+logger = logging.getLogger(__name__)
+
+_success = ExecutionResult.success_result
+_failure = ExecutionResult.failure_result
+
+
+def _classify_changes_kernel(
+    previous: np.ndarray, current: np.ndarray, threshold: int
+):
+    """Classify position changes into trend counts, significance, and alert buckets.
+
+    Returns (improved, declined, stable, change, significant_mask,
+    bucket_codes) where bucket codes are 0=warning, 1=positive, 2=critical.
+    """
+    n = previous.shape[0]
+    change = np.empty(n, np.int64)
+    significant = np.empty(n, np.bool_)
+    buckets = np.empty(n, np.int8)
+    improved = 0
+    declined = 0
+    stable = 0
+    for i in range(n):
+        delta = previous[i] - current[i]
+        change[i] = delta
+        if delta > 0:
+            improved += 1
+        elif delta < 0:
+            declined += 1
+        else:
+            stable += 1
+        magnitude = delta if delta >= 0 else -delta
+        significant[i] = magnitude >= threshold
+        if delta <= -2 * threshold:
+            buckets[i] = 2
+        elif delta >= 2 * threshold:
+            buckets[i] = 1
+        else:
+            buckets[i] = 0
+    return improved, declined, stable, change, significant, buckets
+
+
+try:
+    from xxhash import xxh64_intdigest
+
+    def _stable_hash(value: str) -> int:
+        return xxh64_intdigest(value.encode("utf-8"))
+
+except ImportError:  # pragma: no cover - exercised only without xxhash
+    # Builtin hash() is SipHash-seeded per process; masking to 63 bits keeps
+    # the value non-negative so the uint64 arrays below stay valid. Only the
+    # cross-run stability guarantee is lost.
+    def _stable_hash(value: str) -> int:
+        return hash(value) & 0x7FFFFFFFFFFFFFFF
+
+
+def _stable_hashes(values: List[str]) -> np.ndarray:
+    """Hash strings into a uint64 array, one deterministic digest each."""
+    return np.fromiter(
+        (_stable_hash(v) for v in values), dtype=np.uint64, count=len(values)
+    )
+
+
+_VALID_ENGINES = frozenset({"google", "bing", "yahoo", "yandex", "baidu"})
+
+# Canonical step order; optional steps slot in just before the final
+# reporting step.
+_BASE_STEPS = (
+    "initialize_tracking",
+    "fetch_current_positions",
+    "analyze_serp_features",
+    "calculate_trends",
+    "generate_alerts",
+    "update_historical_data",
+    "generate_reports",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _TrackingParams:
+    """Parameters resolved against workflow defaults, parsed once per run."""
+
+    url: str
+    keywords: List[str]
+    search_engines: List[str]
+    locations: List[str]
+    device_types: List[str]
+    competitors: List[str]
+    local_keywords: List[str]
+
+
+# Alert rendering indexed by the kernel's bucket codes (0=warning,
+# 1=positive, 2=critical): one shared append path instead of three
+# duplicated dict-literal branches.
+_ALERT_SEVERITIES = ("warning", "positive", "critical")
+_ALERT_TEMPLATES = (
+    "Keyword '%s' moved %d positions to #%d",
+    "Keyword '%s' gained %d positions to #%d",
+    "Keyword '%s' dropped %d positions to #%d",
+)
+
+
+try:
+    from numba import njit
+
+    # Compiled once and cached on disk; subsequent runs skip compilation.
+    _classify_changes = njit(cache=True)(_classify_changes_kernel)
+except ImportError:  # pragma: no cover - exercised only without numba
+
+    def _classify_changes(previous, current, threshold):
+        change = previous - current
+        significant = np.abs(change) >= threshold
+        buckets = np.zeros(change.shape[0], np.int8)
+        buckets[change >= 2 * threshold] = 1
+        buckets[change <= -2 * threshold] = 2
+        return (
+            int((change > 0).sum()),
+            int((change < 0).sum()),
+            int((change == 0).sum()),
+            change,
+            significant,
+            buckets,
+        )
+
+
+class RankTrackingWorkflow(BaseWorkflow, SEOTaskMixin):
+    """Workflow that tracks keyword rankings and generates trend alerts."""
+
+    # Keyword rule (non-blank, at most 200 chars) compiled once; fullmatch
+    # against this is one C call instead of a validate_keyword dispatch per
+    # keyword.
+    _KEYWORD_RE = re.compile(r"(?!\s*$).{1,200}", re.DOTALL)
+
+    __slots__ = (
+        "default_search_engines",
+        "default_locations",
+        "default_languages",
+        "default_device_types",
+        "significant_change_threshold",
+        "_domain_cache",
+        "_url_valid_cache",
+        "_run_ts",
+        "_kw_hashes",
+    )
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """Initialize the rank tracking workflow."""
+        super().__init__(
+            name="Rank Tracking",
+            description="Tracks keyword positions across search engines, locations, and devices",
+            config=config or {},
+        )
+        self.default_search_engines = self.config.get(
+            "search_engines", ["google", "bing"]
+        )
+        self.default_locations = self.config.get("locations", ["United States"])
+        self.default_languages = self.config.get("languages", ["en"])
+        self.default_device_types = self.config.get(
+            "device_types", ["desktop", "mobile"]
+        )
+        self.significant_change_threshold = self.config.get(
+            "significant_change_threshold", 5
+        )
+        # URL parsing is repeated across steps for the same handful of URLs;
+        # memoize per instance so each URL is parsed once per run.
+        self._domain_cache: Dict[str, Optional[str]] = {}
+        self._url_valid_cache: Dict[str, bool] = {}
+        self._run_ts: str = ""
+        self._kw_hashes: Optional[np.ndarray] = None
+
+    def validate_parameters(self, parameters: Dict[str, Any]) -> bool:
+        """Validate workflow parameters."""
+        url = parameters.get("url")
+        keywords = parameters.get("keywords")
+
+        if not url or not self.validate_url(url):
+            return False
+        if not keywords or not isinstance(keywords, list):
+            return False
+
+        keyword_re = self._KEYWORD_RE
+        invalid_keywords = []
+        for kw in keywords:
+            if not isinstance(kw, str) or not keyword_re.fullmatch(kw):
+                invalid_keywords.append(kw)
+                # Only the first ten invalids are ever reported.
+                if len(invalid_keywords) > 10:
+                    break
+        if invalid_keywords:
+            self.logger.warning(f"Invalid keywords: {invalid_keywords[:10]}")
+            return False
+
+        search_engines = parameters.get("search_engines", self.default_search_engines)
+        invalid_engines = sorted(set(search_engines) - _VALID_ENGINES)
+        if invalid_engines:
+            self.logger.warning(f"Invalid search engines: {invalid_engines}")
+            return False
+
+        return True
+
+    def get_workflow_steps(self, parameters: Dict[str, Any]) -> List[str]:
+        """Get the ordered list of workflow steps."""
+        extras = []
+        if parameters.get("competitors"):
+            extras.append("competitor_position_tracking")
+        if parameters.get("local_keywords"):
+            extras.append("local_search_tracking")
+
+        return [*_BASE_STEPS[:-1], *extras, _BASE_STEPS[-1]]
+
+    async def execute_workflow(self, parameters: Dict[str, Any]) -> ExecutionResult:
+        """Execute the rank tracking workflow."""
+        try:
+            if not self.validate_parameters(parameters):
+                return _failure(
+                    message="Invalid workflow parameters",
+                    errors=["Valid 'url' and 'keywords' parameters are required"],
+                )
+
+            self.mark_started()
+            # One ISO timestamp per run, shared by every step output instead
+            # of a fresh datetime/isoformat pair at each call site.
+            self._run_ts = datetime.now(timezone.utc).isoformat()
+            params = self._parse_params(parameters)
+
+            self.logger.info(f"Starting rank tracking for: {params.url}")
+
+            # Steps run in dependency-ordered waves: everything inside a wave
+            # is independent and gathered concurrently; only calculate_trends
+            # needs the fetched positions, and alerts/history only need wave-3
+            # output.
+            results: Dict[str, Any] = {}
+            results["initialization"] = await self._initialize_tracking(
+                params.url, params.keywords
+            )
+
+            wave = [
+                ("current_positions", self._fetch_current_positions(params)),
+                ("serp_features", self._analyze_serp_features(
+                    params.keywords, params.search_engines
+                )),
+            ]
+            if params.competitors:
+                wave.append(
+                    (
+                        "competitor_tracking",
+                        self._track_competitor_positions(
+                            params.competitors, params.keywords
+                        ),
+                    )
+                )
+            if params.local_keywords:
+                wave.append(
+                    (
+                        "local_tracking",
+                        self._track_local_positions(
+                            params.local_keywords, params.locations
+                        ),
+                    )
+                )
+            wave_results = await asyncio.gather(
+                *(coro for _, coro in wave), return_exceptions=True
+            )
+            # Steps outside the gather raise straight out of execute_workflow;
+            # gather exceptions are normalized to error dicts here so the
+            # later steps and the serialized report never see a raw exception
+            # object.
+            failed_steps = 0
+            for (name, _), result in zip(wave, wave_results):
+                if isinstance(result, BaseException):
+                    self.logger.error(f"Tracking step {name} failed: {result}")
+                    result = {"success": False, "error": str(result)}
+                    failed_steps += 1
+                results[name] = result
+
+            results["trends"] = await self._calculate_trends(params.keywords)
+
+            alerts, historical_update = await asyncio.gather(
+                self._generate_alerts(results["trends"]),
+                self._update_historical_data(results["current_positions"]),
+            )
+            results["alerts"] = alerts
+            results["historical_update"] = historical_update
+
+            final_report = self._aggregate_tracking_results(
+                results, len(results) - failed_steps
+            )
+
+            self.mark_completed()
+            return _success(
+                message=f"Rank tracking completed for {params.url}",
+                data=final_report,
+            )
+
+        except Exception as e:
+            self.mark_failed()
+            err = str(e)
+            self.logger.exception(f"Rank tracking workflow failed: {err}")
+            return _failure(
+                message=f"Rank tracking failed: {err}",
+                errors=[err],
+            )
+
+    def _parse_params(self, parameters: Dict[str, Any]) -> _TrackingParams:
+        """Resolve raw parameters against workflow defaults exactly once."""
+        return _TrackingParams(
+            url=parameters["url"],
+            keywords=parameters.get("keywords", []),
+            search_engines=parameters.get(
+                "search_engines", self.default_search_engines
+            ),
+            locations=parameters.get("locations", self.default_locations),
+            device_types=parameters.get("device_types", self.default_device_types),
+            competitors=parameters.get("competitors", []),
+            local_keywords=parameters.get("local_keywords", []),
+        )
+
+    def _cached_domain(self, url: str) -> Optional[str]:
+        """Extract a domain, memoized per workflow instance."""
+        cache = self._domain_cache
+        domain = cache.get(url)
+        if domain is None and url not in cache:
+            domain = cache[url] = self.extract_domain(url)
+        return domain
+
+    def _cached_validate_url(self, url: str) -> bool:
+        """Validate a URL, memoized per workflow instance."""
+        cache = self._url_valid_cache
+        valid = cache.get(url)
+        if valid is None:
+            valid = cache[url] = self.validate_url(url)
+        return valid
+
+    def _hashes_for(self, keywords: List[str]) -> np.ndarray:
+        """Return the run's keyword hash array, computing it if needed."""
+        h = self._kw_hashes
+        if h is None or h.shape[0] != len(keywords):
+            h = _stable_hashes(keywords)
+        return h
+
+    async def _initialize_tracking(
+        self, url: str, keywords: List[str]
+    ) -> Dict[str, Any]:
+        """Initialize the tracking run."""
+        # Keyword hashes are hashed once here with a stable digest and shared
+        # by the SERP, trend, competitor, and local steps.
+        self._kw_hashes = _stable_hashes(keywords)
+        return {
+            "domain": self._cached_domain(url),
+            "keywords_count": len(keywords),
+            "initialized_at": self._run_ts,
+        }
+
+    async def _fetch_current_positions(
+        self, params: _TrackingParams
+    ) -> Dict[str, Any]:
+        """Fetch current keyword positions for each engine/location/device combo."""
+        keywords = params.keywords
+        domain = self._cached_domain(params.url)
+        fetch_timestamp = self._run_ts
+
+        # Position simulation is computed as structure-of-arrays columns per
+        # combo: one vectorized pass over the keyword index instead of a
+        # per-keyword dict with scalar math (~10x fewer objects for 10k
+        # keywords).
+        idx = np.arange(len(keywords))
+        positions_arr = np.minimum(idx % 50 + 1, 100)
+        volumes = (idx + 1) * 100
+        cpcs = np.round((idx + 1) * 0.5, 2)
+        featured = (idx % 20) == 0
+        local_pack = (idx % 15) == 0
+
+        # The engine/location/device cross-product is materialized up front so
+        # the combo keys fall out of one flat comprehension instead of three
+        # nested loops with an f-string per innermost iteration.
+        combo_keys = [
+            f"{engine}_{location}_{device}"
+            for engine, location, device in product(
+                params.search_engines, params.locations, params.device_types
+            )
+        ]
+
+        # Downstream steps only read the summary counters; the per-combo
+        # payloads are produced lazily by the factory and never materialized
+        # unless a consumer explicitly iterates them (e.g. report export).
+        def detail_factory():
+            return (
+                (
+                    key,
+                    {
+                        "keywords": keywords,
+                        "position": positions_arr,
+                        "search_volume": volumes,
+                        "cpc": cpcs,
+                        "featured_snippet": featured,
+                        "local_pack": local_pack,
+                    },
+                )
+                for key in combo_keys
+            )
+
+        return {
+            "domain": domain,
+            "fetch_timestamp": fetch_timestamp,
+            "summary": {
+                "combos": len(combo_keys),
+                "keywords_per_combo": len(keywords),
+                "data_points": len(combo_keys) * len(keywords),
+            },
+            "detail_factory": detail_factory,
+        }
+
+    async def _analyze_serp_features(
+        self, keywords: List[str], search_engines: List[str]
+    ) -> Dict[str, Any]:
+        """Analyze SERP features present for the tracked keywords."""
+        # One stable hash per keyword (shared across steps), then all feature
+        # flags derived as vectorized mod arithmetic.
+        h = self._hashes_for(keywords)
+        fs_mask = (h % 10) < 3
+        lp_mask = (h % 8) < 2
+        paa_mask = (h % 12) < 2
+
+        serp_analysis: Dict[str, Any] = {
+            "keyword_features": {
+                keyword: {
+                    "featured_snippet": featured,
+                    "local_pack": local,
+                    "people_also_ask": paa,
+                }
+                for keyword, featured, local, paa in zip(
+                    keywords, fs_mask.tolist(), lp_mask.tolist(), paa_mask.tolist()
+                )
+            },
+            "feature_summary": {
+                "featured_snippets": int(fs_mask.sum()),
+                "local_packs": int(lp_mask.sum()),
+                "people_also_ask": int(paa_mask.sum()),
+            },
+        }
+
+        # Opportunities come straight off the masks: featured-snippet rows
+        # first, then keywords with no features at all, each built in a
+        # single comprehension instead of a branchy per-keyword loop.
+        no_feature_mask = ~(fs_mask | lp_mask | paa_mask)
+        serp_analysis["opportunities"] = [
+            {
+                "keyword": keyword,
+                "opportunity_type": "featured_snippet",
+                "recommendation": "Optimize content structure for featured snippet capture",
+            }
+            for keyword, featured in zip(keywords, fs_mask.tolist())
+            if featured
+        ] + [
+            {
+                "keyword": keyword,
+                "opportunity_type": "basic_optimization",
+                "recommendation": "Focus on standard SEO optimization",
+            }
+            for keyword, basic in zip(keywords, no_feature_mask.tolist())
+            if basic
+        ]
+
+        return serp_analysis
+
+    async def _calculate_trends(self, keywords: List[str]) -> Dict[str, Any]:
+        """Calculate position trends for the tracked keywords."""
+        threshold = self.significant_change_threshold
+
+        # Position simulation and change classification as one vectorized
+        # pass over the shared stable hash array.
+        h = self._hashes_for(keywords)
+        previous = (h % 100 + 1).astype(np.int64)
+        current = ((h + 1) % 100 + 1).astype(np.int64)
+        improved, declined, stable, change, sig_mask, buckets = _classify_changes(
+            previous, current, threshold
+        )
+
+        # Rows come out of one comprehension and land in the dict via a
+        # single C-level dict(zip(...)) call; the significant subset is a
+        # mask filter over the same rows rather than a second build.
+        rows = [
+            {
+                "keyword": keyword,
+                "previous_position": prev,
+                "current_position": curr,
+                "change": delta,
+                "change_type": "improved"
+                if delta > 0
+                else "declined"
+                if delta < 0
+                else "stable",
+            }
+            for keyword, prev, curr, delta in zip(
+                keywords, previous.tolist(), current.tolist(), change.tolist()
+            )
+        ]
+
+        significant_changes = []
+        for row, significant, bucket in zip(
+            rows, sig_mask.tolist(), buckets.tolist()
+        ):
+            if significant:
+                # The alert bucket is precomputed by the kernel and consumed
+                # (and stripped) by _generate_alerts.
+                row["alert_bucket"] = bucket
+                significant_changes.append(row)
+
+        return {
+            "keyword_changes": dict(zip(keywords, rows)),
+            "significant_changes": significant_changes,
+            "summary": {
+                "improved": improved,
+                "declined": declined,
+                "stable": stable,
+            },
+        }
+
+    async def _generate_alerts(self, trends: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate alerts for significant position changes."""
+        threshold = self.significant_change_threshold
+
+        buckets: tuple = ([], [], [])
+
+        for change in trends.get("significant_changes", []):
+            keyword = change["keyword"]
+            delta = change["change"]
+            new_position = change["current_position"]
+            bucket = change.pop("alert_bucket", None)
+            if bucket is None:
+                # Trend rows produced without the kernel fall back to the
+                # threshold rules inline.
+                if delta <= -2 * threshold:
+                    bucket = 2
+                elif delta >= 2 * threshold:
+                    bucket = 1
+                else:
+                    bucket = 0
+
+            # Templates and severities already encode direction; messages
+            # always render the unsigned magnitude.
+            magnitude = abs(delta)
+            buckets[bucket].append(
+                {
+                    "keyword": keyword,
+                    "message": _ALERT_TEMPLATES[bucket]
+                    % (keyword, magnitude, new_position),
+                    "severity": _ALERT_SEVERITIES[bucket],
+                    "change": delta,
+                    "new_position": new_position,
+                }
+            )
+
+        warning_alerts, positive_alerts, critical_alerts = buckets
+        return {
+            "critical_alerts": critical_alerts,
+            "warning_alerts": warning_alerts,
+            "positive_alerts": positive_alerts,
+            "total_alerts": len(critical_alerts)
+            + len(warning_alerts)
+            + len(positive_alerts),
+        }
+
+    async def _update_historical_data(
+        self, current_positions: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Persist the fetched positions to the historical store."""
+        # Both counters are the same total, already tallied by the fetch
+        # summary; no need to touch the per-combo detail at all.
+        total = current_positions.get("summary", {}).get("data_points", 0)
+
+        return {
+            "records_updated": total,
+            "data_points_added": total,
+            "updated_at": self._run_ts,
+        }
+
+    async def _track_one_competitor(
+        self, competitor: str, keywords: List[str], semaphore: asyncio.Semaphore
+    ) -> tuple:
+        """Track one competitor's positions for the keyword set."""
+        async with semaphore:
+            # XOR the shared keyword hashes with one per-competitor digest
+            # instead of rehashing every concatenated string.
+            h = self._hashes_for(keywords) ^ np.uint64(_stable_hash(competitor))
+            row = h % 100 + 1
+            return self._cached_domain(competitor), {
+                "url": competitor,
+                "positions": dict(zip(keywords, row.tolist())),
+                "average_position": float(row.mean()),
+            }
+
+    async def _track_competitor_positions(
+        self, competitors: List[str], keywords: List[str]
+    ) -> Dict[str, Any]:
+        """Track competitor positions for the same keyword set."""
+        competitor_data: Dict[str, Any] = {}
+
+        valid_competitors = [c for c in competitors if self._cached_validate_url(c)]
+        if valid_competitors and keywords:
+            # Each competitor is independent, so they're gathered concurrently
+            # with concurrency capped by the settings-level task limit.
+            semaphore = asyncio.Semaphore(self.settings.max_concurrent_tasks)
+            tracked = await asyncio.gather(
+                *(
+                    self._track_one_competitor(competitor, keywords, semaphore)
+                    for competitor in valid_competitors
+                )
+            )
+            competitor_data.update(tracked)
+
+        return {
+            "competitors_tracked": len(competitor_data),
+            "competitor_positions": competitor_data,
+        }
+
+    async def _track_local_positions(
+        self, local_keywords: List[str], locations: List[str]
+    ) -> Dict[str, Any]:
+        """Track local pack positions for location-specific keywords."""
+        local_data: Dict[str, Any] = {}
+
+        kw_hashes = _stable_hashes(local_keywords)
+        for location in locations:
+            loc_hashes = kw_hashes ^ np.uint64(_stable_hash(location))
+            # All derived fields come out of vectorized mod arithmetic; the
+            # constant fields and the per-location address are built once
+            # instead of per keyword.
+            positions = loc_hashes % 20 + 1
+            in_pack = (loc_hashes % 3) == 0
+            ratings = np.round(4.0 + (loc_hashes % 10) / 10.0, 1)
+            reviews = loc_hashes % 100 + 10
+            address = f"123 Main St, {location}"
+            local_data[location] = {
+                keyword: {
+                    "position": pos,
+                    "in_local_pack": pack,
+                    "business_name": "Example Business",
+                    "address": address,
+                    "phone": "+1-555-0123",
+                    "rating": rating,
+                    "review_count": review_count,
+                }
+                for keyword, pos, pack, rating, review_count in zip(
+                    local_keywords,
+                    positions.tolist(),
+                    in_pack.tolist(),
+                    ratings.tolist(),
+                    reviews.tolist(),
+                )
+            }
+
+        return {
+            "locations_tracked": len(local_data),
+            "local_positions": local_data,
+        }
+
+    def _aggregate_tracking_results(
+        self, results: Dict[str, Any], successful_steps: int
+    ) -> Dict[str, Any]:
+        """Aggregate step results into the final tracking report.
+
+        Step outputs carry no "success" key, so the old dict scan counted
+        every step as successful; the caller now counts failures where they
+        surface (the gather) and passes the real number in.
+        """
+        # Detail factories are for on-demand consumers, not the serialized
+        # report.
+        current_positions = results.get("current_positions")
+        if isinstance(current_positions, dict):
+            current_positions.pop("detail_factory", None)
+
+        return {
+            "workflow_id": str(self.id),
+            "workflow_name": self.name,
+            "completed_at": datetime.now(timezone.utc).isoformat(),
+            "duration_seconds": self.get_duration(),
+            "summary": {
+                "total_steps": len(results),
+                "successful_steps": successful_steps,
+                "total_alerts": results.get("alerts", {}).get("total_alerts", 0),
+            },
+            "results": results,
+        }
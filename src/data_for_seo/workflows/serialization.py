@@ -0,0 +1,24 @@
+"""Report serialization helpers for workflow payloads.
+
+Workflows keep their results as plain dicts/lists/tuples so encoding can be
+deferred to the transport boundary and handled by orjson's C encoder. The
+stdlib json module is used as a fallback when orjson is not installed.
+"""
+
+from typing import Any
+
+try:
+    import orjson
+
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z
+
+    def serialize_report(data: Any) -> bytes:
+        """Serialize a workflow report to JSON bytes."""
+        return orjson.dumps(data, option=_ORJSON_OPTIONS)
+
+except ImportError:  # pragma: no cover - exercised only without orjson
+    import json
+
+    def serialize_report(data: Any) -> bytes:
+        """Serialize a workflow report to JSON bytes."""
+        return json.dumps(data, default=str).encode("utf-8")
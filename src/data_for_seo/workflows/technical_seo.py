@@ -0,0 +1,563 @@
+"""Technical SEO workflow - deep technical analysis of a domain's health."""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+from uuid import uuid4
+
+import numpy as np
+
+from ..agents.base import SEOTaskMixin
+from ..models.base import ExecutionResult
+from .base import BaseWorkflow
+
+logger = logging.getLogger(__name__)
+
+_success = ExecutionResult.success_result
+_failure = ExecutionResult.failure_result
+
+# Core Web Vitals "good" / "needs improvement" boundaries per metric.
+_CWV_THRESHOLDS = {
+    "lcp": np.array([2.5, 4.0]),
+    "fid": np.array([100.0, 300.0]),
+    "cls": np.array([0.1, 0.25]),
+    "inp": np.array([200.0, 500.0]),
+}
+_CWV_LABELS = np.array(["good", "needs_improvement", "poor"])
+
+_REQUIRED_PARAMS = frozenset({"url"})
+
+_UTC = timezone.utc
+
+# Every key a full audit can produce, in report order. Preallocating the
+# results dict from this tuple sizes its hash table once instead of growing
+# it through repeated assignment.
+_RESULT_KEYS = (
+    "initialization",
+    "crawlability",
+    "indexability",
+    "site_structure",
+    "url_analysis",
+    "performance",
+    "core_web_vitals",
+    "mobile_optimization",
+    "security",
+    "schema_markup",
+    "internationalization",
+    "accessibility",
+    "recommendations",
+)
+
+# Constant payload fragments shared by every audit; tuples so they are
+# built once at import instead of per invocation.
+_COMMON_SCHEMA_TYPES = ("Organization", "WebPage", "Article")
+_DEFAULT_LANGUAGES = ("en",)
+_SCHEMA_OPPORTUNITIES = (
+    "Implement Product schema for e-commerce pages",
+    "Add FAQ schema for question pages",
+    "Implement Event schema for event pages",
+)
+
+
+class TechnicalSEOWorkflow(BaseWorkflow, SEOTaskMixin):
+    """Workflow that runs a technical SEO audit across focused analyzers."""
+
+    # step name -> (result key, analyzer method name, pass pages_to_audit).
+    # One table drives both dispatch and result placement; _initialize_audit
+    # and _generate_recommendations stay outside it as bookend phases.
+    _STEP_REGISTRY = (
+        ("crawlability_analysis", "crawlability", "_analyze_crawlability", True),
+        ("indexability_analysis", "indexability", "_analyze_indexability", False),
+        ("site_structure_analysis", "site_structure", "_analyze_site_structure", False),
+        ("url_analysis", "url_analysis", "_analyze_urls", True),
+        ("performance_analysis", "performance", "_analyze_performance", False),
+        (
+            "core_web_vitals_analysis",
+            "core_web_vitals",
+            "_analyze_core_web_vitals",
+            False,
+        ),
+        (
+            "mobile_optimization_analysis",
+            "mobile_optimization",
+            "_analyze_mobile_optimization",
+            False,
+        ),
+        ("security_analysis", "security", "_analyze_security", False),
+        ("schema_markup_analysis", "schema_markup", "_analyze_schema_markup", False),
+        (
+            "internationalization_analysis",
+            "internationalization",
+            "_analyze_internationalization",
+            False,
+        ),
+        ("accessibility_analysis", "accessibility", "_analyze_accessibility", False),
+    )
+
+    __slots__ = (
+        "audit_depth",
+        "max_pages_default",
+        "include_performance",
+        "include_international",
+        "include_accessibility",
+        "max_concurrent_steps",
+        "_step_sem",
+        "_result_cache",
+        "_cache_ttl",
+        "_cache_max",
+    )
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """Initialize the technical SEO workflow."""
+        super().__init__(
+            name="Technical SEO",
+            description="Analyzes crawlability, indexability, performance, and markup health",
+            config=config or {},
+        )
+        self.audit_depth = self.config.get("audit_depth", "comprehensive")
+        self.max_pages_default = self.config.get("max_pages", 100)
+        self.include_performance = self.config.get("include_performance", True)
+        self.include_international = self.config.get("include_international", False)
+        self.include_accessibility = self.config.get("include_accessibility", True)
+        self.max_concurrent_steps = self.config.get("max_concurrent_steps", 5)
+        # Created lazily inside execute_workflow: semaphores must be bound
+        # to the running loop.
+        self._step_sem: Optional[asyncio.Semaphore] = None
+        # Dashboards poll the same URL repeatedly; all analyzer output for a
+        # (step, url, depth) triple is deterministic, so a short TTL cache
+        # skips re-building the payloads entirely on repeat audits.
+        self._result_cache: OrderedDict[tuple, tuple] = OrderedDict()
+        self._cache_ttl = self.config.get("cache_ttl_seconds", 300)
+        self._cache_max = self.config.get("cache_max_entries", 256)
+
+    def validate_parameters(self, parameters: Dict[str, Any]) -> bool:
+        """Validate workflow parameters."""
+        missing = [p for p in _REQUIRED_PARAMS if p not in parameters]
+        if missing:
+            self.logger.warning(f"Missing required parameters: {missing}")
+            return False
+
+        if not self.validate_url(parameters["url"]):
+            return False
+
+        pages_to_audit = parameters.get("pages_to_audit", self.max_pages_default)
+        return isinstance(pages_to_audit, int) and 1 <= pages_to_audit <= 1000
+
+    def get_workflow_steps(self, parameters: Dict[str, Any]) -> List[str]:
+        """Get the ordered analysis steps for this audit."""
+        steps = [
+            "initialize_audit",
+            "crawlability_analysis",
+            "indexability_analysis",
+            "site_structure_analysis",
+            "url_analysis",
+        ]
+        if self.include_performance:
+            steps += [
+                "performance_analysis",
+                "core_web_vitals_analysis",
+                "mobile_optimization_analysis",
+            ]
+        steps += ["security_analysis", "schema_markup_analysis"]
+        if self.include_international:
+            steps.append("internationalization_analysis")
+        if self.include_accessibility:
+            steps.append("accessibility_analysis")
+        steps.append("generate_recommendations")
+        return steps
+
+    async def execute_workflow(self, parameters: Dict[str, Any]) -> ExecutionResult:
+        """Execute the technical SEO workflow."""
+        try:
+            if not self.validate_parameters(parameters):
+                return _failure(
+                    message="Invalid workflow parameters",
+                    errors=["A valid 'url' parameter is required"],
+                )
+
+            self.mark_started()
+            url = parameters["url"]
+            # Every analyzer needs the domain; parse the URL once here
+            # instead of once per step.
+            domain = self.extract_domain(url)
+            pages_to_audit = parameters.get("pages_to_audit", self.max_pages_default)
+            audit_depth = parameters.get("audit_depth", self.audit_depth)
+            steps = self.get_workflow_steps(parameters)
+
+            self.logger.info(f"Starting technical SEO audit for: {url}")
+
+            results: Dict[str, Any] = dict.fromkeys(_RESULT_KEYS)
+
+            # Initialization stays sequential: it seeds the audit id the
+            # other steps are reported under.
+            init_result = await self.execute_step(
+                "initialize_audit", self._initialize_audit, url, domain, parameters
+            )
+            results["initialization"] = init_result.data if init_result.success else {}
+
+            # The analyzers are independent of each other (only the final
+            # recommendations step consumes their output), so they fan out
+            # through one gather and the audit is bounded by the slowest
+            # analyzer instead of the sum of all of them. The registry keeps
+            # dispatch declarative; step_set gives O(1) membership checks.
+            step_set = frozenset(steps)
+            specs = [
+                (
+                    key,
+                    getattr(self, fn_name),
+                    (url, domain, pages_to_audit) if needs_pages else (url, domain),
+                    # The cache key must cover every input that shapes the
+                    # analyzer's output: the per-run depth for all steps, and
+                    # pages_to_audit for the steps that consume it.
+                    (key, url, audit_depth, pages_to_audit)
+                    if needs_pages
+                    else (key, url, audit_depth),
+                )
+                for step, key, fn_name, needs_pages in self._STEP_REGISTRY
+                if step in step_set
+            ]
+
+            # The fan-out stays bounded so ten analyzers don't slam the
+            # downstream APIs at once.
+            self._step_sem = asyncio.Semaphore(self.max_concurrent_steps)
+
+            async def bounded_step(name: str, fn, args: tuple, key: tuple):
+                cached = self._cache_get(key)
+                if cached is not None:
+                    return name, cached
+                async with self._step_sem:
+                    result = await self.execute_step(name, fn, *args)
+                if result.success:
+                    self._cache_put(key, result)
+                return name, result
+
+            # Consume analyzers as they finish so the recommendation rules
+            # for the fast steps run while the slowest one is still in
+            # flight; by the time the last analyzer lands, the aggregate is
+            # already mostly built.
+            recommendations = {"critical": [], "high": [], "medium": []}
+            for next_done in asyncio.as_completed(
+                [bounded_step(name, fn, args, key) for name, fn, args, key in specs]
+            ):
+                name, step_result = await next_done
+                data = step_result.data if step_result.success else {}
+                results[name] = data
+                self._ingest_partial_recommendation(name, data, recommendations)
+
+            # Steps disabled by configuration never ran; drop their None
+            # placeholders from the report.
+            results = {k: v for k, v in results.items() if v is not None}
+            recommendations["total_recommendations"] = sum(
+                len(v) for v in recommendations.values()
+            )
+            results["recommendations"] = recommendations
+
+            self.mark_completed()
+            return _success(
+                message=f"Technical SEO audit completed for {url}",
+                data={
+                    "workflow_id": str(self.id),
+                    "workflow_name": self.name,
+                    "completed_at": datetime.now(_UTC).isoformat(timespec="seconds"),
+                    "duration_seconds": self.get_duration(),
+                    "results": results,
+                },
+            )
+
+        except Exception as e:
+            self.mark_failed()
+            err = str(e)
+            self.logger.exception(f"Technical SEO workflow failed: {err}")
+            return _failure(
+                message=f"Technical SEO audit failed: {err}",
+                errors=[err],
+            )
+
+    async def execute_step(
+        self, step_name: str, step_function, *args: Any
+    ) -> ExecutionResult:
+        """Execute one audit step and normalize errors into a failure result."""
+        try:
+            data = await step_function(*args)
+            return _success(message=f"Step {step_name} completed", data=data)
+        except Exception as e:
+            self.logger.error(f"Step {step_name} failed: {e}")
+            return _failure(message=f"Step {step_name} failed", errors=[str(e)])
+
+    def _cache_get(self, key: tuple) -> Optional[ExecutionResult]:
+        """Return a cached step result if present and not expired."""
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if time.monotonic() >= expires_at:
+            del self._result_cache[key]
+            return None
+        self._result_cache.move_to_end(key)
+        return result
+
+    def _cache_put(self, key: tuple, result: ExecutionResult) -> None:
+        """Store a step result, evicting the least recently used entry."""
+        self._result_cache[key] = (time.monotonic() + self._cache_ttl, result)
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > self._cache_max:
+            self._result_cache.popitem(last=False)
+
+    def _metric_bank(self, domain: str, prefix: str, count: int) -> List[int]:
+        """Produce deterministic pseudo-metric ints for a (domain, step) pair.
+
+        One seeded RNG replaces the per-field hash(f"{domain}_...") calls:
+        the whole vector comes from a single C-level integers() draw
+        instead of a string hash plus modulo per metric, and the byte-based
+        seed keeps it stable across processes.
+        """
+        rng = np.random.default_rng(list(f"{domain}:{prefix}".encode()))
+        return rng.integers(0, 1 << 32, size=count).tolist()
+
+    async def _initialize_audit(
+        self, url: str, domain: str, parameters: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Initialize the audit run."""
+        return {
+            "audit_id": str(uuid4()),
+            "domain": domain,
+            "url": url,
+            "audit_depth": parameters.get("audit_depth", self.audit_depth),
+            "started_at": datetime.now(_UTC).isoformat(timespec="seconds"),
+        }
+
+    async def _analyze_crawlability(
+        self, url: str, domain: str, pages_to_audit: int
+    ) -> Dict[str, Any]:
+        """Analyze how easily crawlers can reach the site's pages."""
+        bank = self._metric_bank(domain, "crawlability", 8)
+        crawlability_analysis = {
+            "robots_txt": {
+                "exists": bank[0] % 10 > 1,
+                "blocked_paths": bank[1] % 5,
+                "crawl_delay": bank[2] % 3,
+            },
+            "crawl_budget": {
+                "pages_crawled": min(bank[3] % 500 + 50, pages_to_audit),
+                "crawl_errors": bank[4] % 10,
+                "redirect_chains": bank[5] % 8,
+            },
+            "internal_linking": {
+                "orphaned_pages": bank[6] % 8,
+                "link_depth_average": bank[7] % 4 + 2,
+                "issues": [],
+            },
+        }
+
+        linking = crawlability_analysis["internal_linking"]
+        issues = linking["issues"]
+        if linking["orphaned_pages"] > 5:
+            issues.append("High number of orphaned pages detected")
+        if linking["link_depth_average"] > 4:
+            issues.append("Important pages are too deep in the site structure")
+
+        return crawlability_analysis
+
+    async def _analyze_indexability(self, url: str, domain: str) -> Dict[str, Any]:
+        """Analyze whether pages can be indexed correctly."""
+        bank = self._metric_bank(domain, "indexability", 8)
+        indexability_analysis = {
+            "indexed_pages": bank[0] % 1000 + 100,
+            "noindex_pages": bank[1] % 20,
+            "canonical_tags": {
+                "missing": bank[2] % 15,
+                "self_referencing": bank[3] % 90 + 10,
+                "conflicting": bank[4] % 5,
+                "issues": [],
+            },
+            "sitemap": {
+                "exists": bank[5] % 10 > 0,
+                "url_count": bank[6] % 900 + 100,
+                "errors": bank[7] % 5,
+            },
+        }
+
+        canonical = indexability_analysis["canonical_tags"]
+        issues = canonical["issues"]
+        if canonical["missing"] > 10:
+            issues.append("Many pages missing canonical tags")
+        if canonical["conflicting"] > 2:
+            issues.append("Conflicting canonical signals detected")
+
+        return indexability_analysis
+
+    async def _analyze_site_structure(self, url: str, domain: str) -> Dict[str, Any]:
+        """Analyze the site's structural hierarchy."""
+        bank = self._metric_bank(domain, "site_structure", 6)
+        return {
+            "depth_distribution": {
+                "level_1": bank[0] % 20 + 5,
+                "level_2": bank[1] % 100 + 20,
+                "level_3": bank[2] % 300 + 50,
+                "level_4_plus": bank[3] % 100,
+            },
+            "category_count": bank[4] % 15 + 3,
+            "breadcrumbs_present": bank[5] % 10 > 2,
+        }
+
+    async def _analyze_urls(
+        self, url: str, domain: str, pages_to_audit: int
+    ) -> Dict[str, Any]:
+        """Analyze URL hygiene across the audited pages."""
+        bank = self._metric_bank(domain, "urls", 4)
+        return {
+            "pages_checked": pages_to_audit,
+            "url_length_average": bank[0] % 40 + 30,
+            "dynamic_urls": bank[1] % 30,
+            "uppercase_urls": bank[2] % 10,
+            "underscore_urls": bank[3] % 12,
+        }
+
+    async def _analyze_performance(self, url: str, domain: str) -> Dict[str, Any]:
+        """Analyze page load performance."""
+        bank = self._metric_bank(domain, "performance", 4)
+        return {
+            "load_time_desktop": round(bank[0] % 30 / 10 + 1, 1),
+            "load_time_mobile": round(bank[1] % 40 / 10 + 2, 1),
+            "page_size_kb": bank[2] % 2000 + 500,
+            "request_count": bank[3] % 80 + 20,
+        }
+
+    async def _analyze_core_web_vitals(self, url: str, domain: str) -> Dict[str, Any]:
+        """Analyze Core Web Vitals metrics."""
+        bank = self._metric_bank(domain, "core_web_vitals", 8)
+        cwv = {
+            "lcp": {
+                "desktop": round(bank[0] % 30 / 10 + 1.5, 1),
+                "mobile": round(bank[1] % 40 / 10 + 2.0, 1),
+            },
+            "fid": {
+                "desktop": bank[2] % 150 + 50,
+                "mobile": bank[3] % 250 + 80,
+            },
+            "cls": {
+                "desktop": round(bank[4] % 20 / 100, 2),
+                "mobile": round(bank[5] % 30 / 100, 2),
+            },
+            "inp": {
+                "desktop": bank[6] % 300 + 100,
+                "mobile": bank[7] % 400 + 150,
+            },
+        }
+
+        # One searchsorted per metric buckets both devices at once and
+        # keeps the ratings attributed per device (the old if/elif loop
+        # overwrote a single "rating" key with the last device's value).
+        for metric, values in cwv.items():
+            idx = np.searchsorted(
+                _CWV_THRESHOLDS[metric],
+                [values["desktop"], values["mobile"]],
+            )
+            ratings = _CWV_LABELS[idx].tolist()
+            values["desktop_rating"], values["mobile_rating"] = ratings
+
+        return cwv
+
+    async def _analyze_mobile_optimization(
+        self, url: str, domain: str
+    ) -> Dict[str, Any]:
+        """Analyze mobile-friendliness signals."""
+        bank = self._metric_bank(domain, "mobile", 4)
+        return {
+            "viewport_configured": bank[0] % 10 > 1,
+            "tap_targets_ok": bank[1] % 10 > 2,
+            "font_size_ok": bank[2] % 10 > 1,
+            "content_wider_than_screen": bank[3] % 10 < 2,
+        }
+
+    async def _analyze_security(self, url: str, domain: str) -> Dict[str, Any]:
+        """Analyze security configuration."""
+        # urlsplit is C-implemented and caches recent results, so this
+        # is cheaper than scanning the string for each scheme variant.
+        https_enabled = urlsplit(url).scheme == "https"
+        bank = self._metric_bank(domain, "security", 3)
+        return {
+            "https_enabled": https_enabled,
+            "domain": domain,
+            "hsts_enabled": bank[0] % 10 > 4,
+            "mixed_content_pages": bank[1] % 8,
+            "insecure_forms": bank[2] % 4,
+        }
+
+    async def _analyze_schema_markup(self, url: str, domain: str) -> Dict[str, Any]:
+        """Analyze structured data coverage."""
+        bank = self._metric_bank(domain, "schema", 2)
+        return {
+            "schema_types": _COMMON_SCHEMA_TYPES,
+            "pages_with_schema": bank[0] % 300 + 50,
+            "validation_errors": bank[1] % 10,
+            "opportunities": _SCHEMA_OPPORTUNITIES,
+        }
+
+    async def _analyze_internationalization(
+        self, url: str, domain: str
+    ) -> Dict[str, Any]:
+        """Analyze international targeting configuration."""
+        bank = self._metric_bank(domain, "i18n", 3)
+        return {
+            "hreflang_present": bank[0] % 10 > 6,
+            "hreflang_errors": bank[1] % 5,
+            "content_languages": _DEFAULT_LANGUAGES,
+            "geo_targeting_configured": bank[2] % 10 > 5,
+        }
+
+    async def _analyze_accessibility(self, url: str, domain: str) -> Dict[str, Any]:
+        """Analyze accessibility signals."""
+        bank = self._metric_bank(domain, "accessibility", 4)
+        return {
+            "accessibility_score": bank[0] % 30 + 70,
+            "missing_alt_text": bank[1] % 20,
+            "low_contrast_elements": bank[2] % 15,
+            "missing_aria_labels": bank[3] % 10,
+        }
+
+    def _ingest_partial_recommendation(
+        self, name: str, data: Dict[str, Any], agg: Dict[str, List[str]]
+    ) -> None:
+        """Fold one analyzer's output into the running recommendation lists.
+
+        Every rule only reads its own analyzer's payload, so each result
+        can be ingested the moment it arrives. Per-step work is tiny,
+        which is what lets the streaming loop run it inline without
+        stalling the event loop.
+        """
+        critical = agg["critical"]
+        high = agg["high"]
+        medium = agg["medium"]
+
+        if name == "security" and data:
+            if not data.get("https_enabled", True):
+                critical.append("Migrate the site to HTTPS")
+            if data.get("mixed_content_pages", 0) > 3:
+                high.append("Resolve mixed content on affected pages")
+        elif name == "crawlability":
+            linking = data.get("internal_linking", {})
+            if linking.get("orphaned_pages", 0) > 5:
+                high.append("Link orphaned pages into the site structure")
+            medium.extend(linking.get("issues", []))
+        elif name == "indexability":
+            high.extend(data.get("canonical_tags", {}).get("issues", []))
+            if data.get("noindex_pages", 0) > 10:
+                medium.append("Review noindex usage across the site")
+        elif name == "core_web_vitals":
+            for metric in ("lcp", "fid", "cls", "inp"):
+                values = data.get(metric, {})
+                if "poor" in (
+                    values.get("desktop_rating"),
+                    values.get("mobile_rating"),
+                ):
+                    high.append(f"Improve {metric.upper()} to meet Core Web Vitals")
+        elif name == "accessibility":
+            if data.get("accessibility_score", 100) < 80:
+                medium.append("Address accessibility issues to reach a score of 80+")
+        elif name == "schema_markup":
+            medium.extend(data.get("opportunities", []))
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Standalone structure check for the workflow package.
+
+Verifies that the workflow modules exist, define their classes, and
+contain the expected implementation features, without importing the
+package (so it runs even when optional dependencies are missing).
+
+Usage: python test_workflow_structure.py
+"""
+
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+WORKFLOW_DIR = Path(__file__).parent / "src" / "data_for_seo" / "workflows"
+
+REQUIRED_FILES = (
+    "__init__.py",
+    "base.py",
+    "content_optimization.py",
+    "rank_tracking.py",
+    "seo_audit.py",
+    "technical_seo.py",
+    "engine.py",
+)
+
+EXPECTED_CLASSES = {
+    "base.py": "class BaseWorkflow",
+    "content_optimization.py": "class ContentOptimizationWorkflow",
+    "rank_tracking.py": "class RankTrackingWorkflow",
+    "seo_audit.py": "class SEOAuditWorkflow",
+    "technical_seo.py": "class TechnicalSEOWorkflow",
+    "engine.py": "class WorkflowEngine",
+}
+
+# Compiled once at import; the patterns are real regexes, so the old
+# substring checks silently never matched "aggregate.*results".
+FEATURES_TO_CHECK = {
+    "async step execution": re.compile(r"async def execute_"),
+    "concurrent fan-out": re.compile(r"asyncio\.gather"),
+    "bounded concurrency": re.compile(r"Semaphore"),
+    "parameter validation": re.compile(r"def validate_parameters"),
+    "step planning": re.compile(r"def get_workflow_steps"),
+    "result aggregation": re.compile(r"aggregate.*results"),
+    "logging": re.compile(r"self\.logger"),
+}
+
+
+def test_workflow_structure():
+    """Check workflow files, classes, features, and basic stats."""
+    # Buffered reporting: each line is appended to a list and the whole
+    # report is flushed with one write, instead of one line-buffered
+    # syscall per print.
+    out = []
+    p = out.append
+    p("=" * 60)
+    p("Workflow structure check")
+    p("=" * 60)
+
+    p(f"\nWorkflow directory: {WORKFLOW_DIR}")
+
+    # One scandir pass replaces an exists() plus stat() syscall pair per
+    # required file; DirEntry serves the size from the dirent it already
+    # fetched.
+    entries = {entry.name: entry for entry in os.scandir(WORKFLOW_DIR)}
+    missing_files = []
+    for file_name in REQUIRED_FILES:
+        entry = entries.get(file_name)
+        if entry is not None:
+            p(f"  [ok] {file_name} ({entry.stat().st_size} bytes)")
+        else:
+            missing_files.append(file_name)
+            p(f"  [MISSING] {file_name}")
+
+    if missing_files:
+        p(f"\nMissing files: {missing_files}")
+        sys.stdout.write("\n".join(out) + "\n")
+        return False
+
+    # Per-file work (read, feature scan, stats) is independent, so it
+    # fans out over a small thread pool: file reads release the GIL, and
+    # regex scans over the larger modules overlap with the I/O. Results
+    # come back in submission order, so report ordering is stable.
+    def analyze(name):
+        body = (WORKFLOW_DIR / name).read_text(encoding="utf-8")
+        features = {
+            feature: bool(pattern.search(body))
+            for feature, pattern in FEATURES_TO_CHECK.items()
+        }
+        # Every file ends with a newline, so counting "\n" matches a
+        # line iteration; "def " alone avoids double-counting async defs.
+        return name, body, body.count("\n"), body.count("def "), features
+
+    check_files = [name for name in REQUIRED_FILES if name != "__init__.py"]
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        analyzed = list(pool.map(analyze, check_files))
+    contents = {name: body for name, body, _, _, _ in analyzed}
+    init_content = (WORKFLOW_DIR / "__init__.py").read_text(encoding="utf-8")
+
+    p("\nClass definitions:")
+    all_classes_found = True
+    for file_name, class_def in EXPECTED_CLASSES.items():
+        if class_def in contents[file_name]:
+            p(f"  [ok] {file_name}: {class_def}")
+        else:
+            all_classes_found = False
+            p(f"  [MISSING] {file_name}: {class_def}")
+
+    p("\nRe-exports in __init__.py:")
+    for file_name, class_def in EXPECTED_CLASSES.items():
+        class_name = class_def.removeprefix("class ")
+        if class_name in init_content:
+            p(f"  [ok] {class_name}")
+        else:
+            p(f"  [not exported] {class_name}")
+
+    p("\nImplementation features:")
+    for feature in FEATURES_TO_CHECK:
+        hits = [name for name, _, _, _, feats in analyzed if feats[feature]]
+        p(f"  {feature}: {len(hits)} file(s)")
+        for name in hits:
+            p(f"    - {name}")
+
+    p("\nFile statistics:")
+    for name, _, line_count, method_count, _ in analyzed:
+        p(f"  {name}: {line_count} lines, {method_count} methods")
+
+    p("\n" + "=" * 60)
+    if all_classes_found:
+        p("Structure check passed")
+    else:
+        p("Structure check FAILED: missing class definitions")
+    p("=" * 60)
+    sys.stdout.write("\n".join(out) + "\n")
+    return all_classes_found
+
+
+if __name__ == "__main__":
+    raise SystemExit(0 if test_workflow_structure() else 1)
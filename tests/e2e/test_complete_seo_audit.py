@@ -0,0 +1,40 @@
+"""End-to-end tests for a complete SEO audit run.
+
+The scenarios below exercise the full audit pipeline against a live-like
+environment and are placeholders until that environment exists. The skip
+is applied once at module level: pytest marks every test at collection,
+so none of them run fixture setup (including the autouse environment
+fixture) just to report a skip.
+"""
+
+import pytest
+
+pytestmark = pytest.mark.skip(reason="pending implementation")
+
+
+class TestCompleteSEOAudit:
+    """Full audit pipeline scenarios."""
+
+    async def test_full_site_audit_completes(self, seo_analyzer_agent):
+        """A full site audit runs every workflow step to completion."""
+        pass
+
+    async def test_audit_report_structure(self, seo_analyzer_agent):
+        """The aggregated report contains every expected section."""
+        pass
+
+    async def test_audit_recommendations_prioritized(self, seo_analyzer_agent):
+        """Recommendations are bucketed by priority and effort."""
+        pass
+
+    async def test_audit_handles_unreachable_site(self, seo_analyzer_agent):
+        """An unreachable site fails gracefully with a failure result."""
+        pass
+
+    async def test_concurrent_audits_are_isolated(self, seo_analyzer_agent):
+        """Two audits running concurrently do not share mutable state."""
+        pass
+
+    async def test_audit_respects_page_limit(self, seo_analyzer_agent):
+        """The pages_to_audit parameter bounds the crawl."""
+        pass
@@ -0,0 +1,75 @@
+"""Tests for the change-classification kernel and alert generation."""
+
+import numpy as np
+import pytest
+
+from data_for_seo.workflows.rank_tracking import (
+    RankTrackingWorkflow,
+    _classify_changes,
+    _classify_changes_kernel,
+)
+
+pytestmark = pytest.mark.unit
+
+_PREVIOUS = np.array([20, 3, 5, 50, 14], dtype=np.int64)
+_CURRENT = np.array([5, 18, 5, 62, 10], dtype=np.int64)
+_THRESHOLD = 5
+
+
+def test_kernel_classifies_trends_and_buckets():
+    improved, declined, stable, change, significant, buckets = _classify_changes(
+        _PREVIOUS, _CURRENT, _THRESHOLD
+    )
+
+    assert (improved, declined, stable) == (2, 2, 1)
+    assert change.tolist() == [15, -15, 0, -12, 4]
+    assert significant.tolist() == [True, True, False, True, False]
+    # 0=warning, 1=positive (>= 2x threshold gain), 2=critical (>= 2x drop)
+    assert buckets.tolist() == [1, 2, 0, 2, 0]
+
+
+def test_fallback_kernel_matches_loop_kernel():
+    expected = _classify_changes_kernel(_PREVIOUS, _CURRENT, _THRESHOLD)
+    actual = _classify_changes(_PREVIOUS, _CURRENT, _THRESHOLD)
+
+    assert expected[:3] == actual[:3]
+    for exp_arr, act_arr in zip(expected[3:], actual[3:]):
+        assert np.array_equal(exp_arr, act_arr)
+
+
+async def test_alerts_render_unsigned_magnitudes():
+    workflow = RankTrackingWorkflow()
+    trends = {
+        "significant_changes": [
+            {"keyword": "kw-warn", "change": -4, "current_position": 9, "alert_bucket": 0},
+            {"keyword": "kw-crit", "change": -12, "current_position": 40, "alert_bucket": 2},
+            {"keyword": "kw-pos", "change": 11, "current_position": 3, "alert_bucket": 1},
+        ]
+    }
+
+    alerts = await workflow._generate_alerts(trends)
+
+    assert alerts["total_alerts"] == 3
+    assert alerts["warning_alerts"][0]["message"] == (
+        "Keyword 'kw-warn' moved 4 positions to #9"
+    )
+    assert alerts["critical_alerts"][0]["message"] == (
+        "Keyword 'kw-crit' dropped 12 positions to #40"
+    )
+    assert alerts["positive_alerts"][0]["message"] == (
+        "Keyword 'kw-pos' gained 11 positions to #3"
+    )
+
+
+async def test_alerts_fall_back_to_threshold_rules_without_buckets():
+    workflow = RankTrackingWorkflow(config={"significant_change_threshold": 5})
+    trends = {
+        "significant_changes": [
+            {"keyword": "kw", "change": -10, "current_position": 30},
+        ]
+    }
+
+    alerts = await workflow._generate_alerts(trends)
+
+    assert alerts["critical_alerts"][0]["severity"] == "critical"
+    assert alerts["warning_alerts"] == []
@@ -0,0 +1,95 @@
+"""Tests for the TTL'd LRU result caches in the audit workflows."""
+
+import pytest
+
+from data_for_seo.workflows.seo_audit import SEOAuditWorkflow
+from data_for_seo.workflows.technical_seo import TechnicalSEOWorkflow
+
+pytestmark = pytest.mark.unit
+
+
+async def test_technical_seo_cache_keyed_on_pages_to_audit():
+    workflow = TechnicalSEOWorkflow()
+
+    first = await workflow.execute_workflow(
+        {"url": "https://example.com", "pages_to_audit": 500}
+    )
+    second = await workflow.execute_workflow(
+        {"url": "https://example.com", "pages_to_audit": 5}
+    )
+    repeat = await workflow.execute_workflow(
+        {"url": "https://example.com", "pages_to_audit": 5}
+    )
+
+    # A different page budget must not serve the stale payload, while an
+    # identical re-audit within the TTL still hits the cache.
+    assert first.data["results"]["crawlability"] != second.data["results"]["crawlability"]
+    assert repeat.data["results"]["crawlability"] == second.data["results"]["crawlability"]
+
+
+async def test_technical_seo_cache_keyed_on_run_depth():
+    workflow = TechnicalSEOWorkflow()
+
+    await workflow.execute_workflow(
+        {"url": "https://example.com", "audit_depth": "basic"}
+    )
+
+    assert any(key[2] == "basic" for key in workflow._result_cache)
+
+
+def test_technical_seo_cache_expires_and_evicts():
+    workflow = TechnicalSEOWorkflow(
+        config={"cache_ttl_seconds": 0, "cache_max_entries": 2}
+    )
+
+    workflow._cache_put(("a",), "first")
+    # TTL of zero expires entries immediately.
+    assert workflow._cache_get(("a",)) is None
+
+    workflow._cache_ttl = 300
+    workflow._cache_put(("a",), "first")
+    workflow._cache_put(("b",), "second")
+    workflow._cache_put(("c",), "third")
+    # Oldest entry is evicted once the cache exceeds cache_max_entries.
+    assert ("a",) not in workflow._result_cache
+    assert workflow._cache_get(("c",)) == "third"
+
+
+async def test_seo_audit_run_cached_serves_hits_without_rerunning():
+    workflow = SEOAuditWorkflow()
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        return {"value": calls}
+
+    first = await workflow._run_cached(("step", "url"), factory)
+    second = await workflow._run_cached(("step", "url"), factory)
+
+    assert first == second == {"value": 1}
+    assert calls == 1
+
+
+async def test_seo_audit_run_cached_expires_and_evicts():
+    workflow = SEOAuditWorkflow(
+        config={"result_cache_ttl": 0, "result_cache_max": 1}
+    )
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        return calls
+
+    await workflow._run_cached(("step", "url"), factory)
+    await workflow._run_cached(("step", "url"), factory)
+    # TTL of zero forces a fresh run on every call.
+    assert calls == 2
+
+    workflow._cache_ttl = 300
+    await workflow._run_cached(("one",), factory)
+    await workflow._run_cached(("two",), factory)
+    # Only the newest entry survives a cache bounded to one slot.
+    assert len(workflow._result_cache) == 1
+    assert ("two",) in workflow._result_cache
@@ -0,0 +1,94 @@
+"""Failure-path tests: a raising step must not poison the final report."""
+
+import pytest
+
+from data_for_seo.workflows.content_optimization import ContentOptimizationWorkflow
+from data_for_seo.workflows.rank_tracking import RankTrackingWorkflow
+from data_for_seo.workflows.serialization import serialize_report
+
+pytestmark = pytest.mark.unit
+
+
+# The workflow classes are fully slotted, so failing steps are injected
+# through subclasses rather than instance monkeypatching.
+class _FailingFetchRankTracking(RankTrackingWorkflow):
+    __slots__ = ()
+
+    async def _fetch_current_positions(self, params):
+        raise ConnectionError("dns failure")
+
+
+class _FailingSerpRankTracking(RankTrackingWorkflow):
+    __slots__ = ()
+
+    async def _analyze_serp_features(self, keywords, search_engines):
+        raise ConnectionError("serp api down")
+
+
+class _FailingReadabilityOptimization(ContentOptimizationWorkflow):
+    __slots__ = ()
+
+    async def _analyze_readability(self, content):
+        raise ConnectionError("readability svc down")
+
+
+class _FailingSEOOptimization(ContentOptimizationWorkflow):
+    __slots__ = ()
+
+    async def _analyze_seo_elements(self, content, target_keywords):
+        raise ValueError("parse error")
+
+
+async def test_rank_tracking_required_step_failure_stays_serializable():
+    result = await _FailingFetchRankTracking().execute_workflow(
+        {"url": "https://example.com", "keywords": ["seo tools"]}
+    )
+
+    assert result.success
+    assert result.data["results"]["current_positions"] == {
+        "success": False,
+        "error": "dns failure",
+    }
+    # The historical update consumes the error dict without crashing.
+    assert result.data["results"]["historical_update"]["records_updated"] == 0
+    assert isinstance(serialize_report(result.data), bytes)
+
+
+async def test_rank_tracking_optional_step_failure_counted_and_serializable():
+    result = await _FailingSerpRankTracking().execute_workflow(
+        {"url": "https://example.com", "keywords": ["seo tools"]}
+    )
+
+    assert result.success
+    assert result.data["results"]["serp_features"]["error"] == "serp api down"
+    summary = result.data["summary"]
+    assert summary["successful_steps"] == summary["total_steps"] - 1
+    assert isinstance(serialize_report(result.data), bytes)
+
+
+async def test_content_optimization_stage_failure_stays_serializable():
+    result = await _FailingReadabilityOptimization().execute_workflow(
+        {"url": "https://example.com", "target_keywords": ["seo"]}
+    )
+
+    assert result.success
+    assert result.data["results"]["readability_analysis"] == {
+        "success": False,
+        "error": "readability svc down",
+    }
+    summary = result.data["summary"]
+    assert summary["successful_steps"] == summary["total_steps"] - 1
+    assert isinstance(serialize_report(result.data), bytes)
+
+
+async def test_content_optimization_plan_skips_failed_seo_stage():
+    result = await _FailingSEOOptimization().execute_workflow(
+        {"url": "https://example.com", "target_keywords": ["seo"]}
+    )
+
+    assert result.success
+    # The plan generator skips the failed stage instead of KeyError-ing
+    # on its missing sections.
+    assert result.data["results"]["seo_analysis"]["success"] is False
+    assert "executive_summary" in result.data["optimization_plan"]
+    assert isinstance(serialize_report(result.data), bytes)